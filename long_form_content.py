@@ -4,31 +4,23 @@ import os
 import uuid
 from pprint import pprint
 from typing import Optional, Literal, Union
-import json
 from pathlib import Path
 import asyncio
 from datetime import datetime
 # third party packages
 import ffmpeg
-from langchain.messages import AIMessage, HumanMessage, SystemMessage
-
 from langgraph.graph import StateGraph
 from langgraph.constants import START, END
 from pydantic import BaseModel, Field
 from langchain.chat_models import init_chat_model
 from elevenlabs import ElevenLabs
 # my modules
-from system_prompts import (
-    short_form_video_goal_generation_system_prompt,
-    short_form_script_generation_system_prompt,
-    script_enhancer_elevenlabs_v3_system_prompt, script_segmentation_system_prompt,
-    image_descriptions_generator_system_prompt, generate_segment_image_descriptions_system_prompt,
-    long_form_video_structure_generation_system_prompt, long_form_video_topic_section_script_generation_system_prompt,
-    long_form_video_section_script_segmenter_system_prompt
-)
+from system_prompts import PROMPTS, system_prompt_with_examples
+from schemas import SectionStructure, SectionsStructureContainer
 from utils import animate_with_motion_effect
 from utils import model_providers, image_models, image_styles, voice_model_versions, voice_models, voice_actors
-from utils import get_video_duration, generate_image, pseudo_generate_image
+from utils import STRUCTURED_OUTPUT_METHOD, build_messages, invoke_with_response_cache, get_video_duration, generate_image, pseudo_generate_image
+from utils import REPLAY_TTL_SECONDS, enhance_script_selectively
 from concurrent.futures import ProcessPoolExecutor
 NUM_WORKERS = os.cpu_count()
 # AI Models
@@ -42,15 +34,6 @@ ai_voice_model = ElevenLabs(api_key=os.getenv("ELEVEN_LABS_API_KEY"))
 class GoalContainer(BaseModel):
     goal: str = Field(..., description="The goal of the video to be produced.")
 
-class SectionStructure(BaseModel):
-    section_name: str = Field(..., description="A descriptive name for the section.")
-    section_purpose: str = Field(..., description="The purpose of the section in paragraph format explaining the strategic function of it.")
-    section_directives: list[str] = Field(..., description="A list of directives that define the section's purpose.")
-    section_talking_points: list[list] = Field(..., description="A list of talking points that will be discussed within this section.")
-
-class SectionsStructureContainer(BaseModel):
-    sections_structure_list: list[SectionStructure] = Field(..., description="A list of section structures for the video.")
-
 class SectionScriptContainer(BaseModel):
     section_script: str = Field(..., description="The complete narration (script) for a section of the video as a single string.")
 
@@ -226,16 +209,14 @@ def generate_goal(state: AgentState) -> dict[str, str]:
     """
     if state.debug_mode:
         print("Generating goal...")
-    model_for_goal = ai_model.with_structured_output(GoalContainer)
-    payload = json.dumps({
+    model_for_goal = ai_model.with_structured_output(GoalContainer, method=STRUCTURED_OUTPUT_METHOD)
+    payload = {
         "topic": state.topic,
         "purpose": state.purpose,
         "target_audience": state.target_audience,
-    })
-    system_message = AIMessage(content=short_form_video_goal_generation_system_prompt)
-    user_message = HumanMessage(content=payload)
-    messages = [system_message, user_message]
-    goal_container: BaseModel = model_for_goal.invoke(messages)
+    }
+    goal_container: BaseModel = invoke_with_response_cache(
+        model_for_goal, "goal", payload, lambda: build_messages(system_prompt_with_examples("goal", payload), payload))
     return {"goal": goal_container.goal}
 
 # semi done
@@ -247,19 +228,18 @@ def generate_structure(state: AgentState) -> dict[str, list]:
     """
     if state.debug_mode:
         print("Generating Video Structure ...")
-    model_for_sections_structure = ai_model.with_structured_output(SectionsStructureContainer)
-    payload = json.dumps({
+    model_for_sections_structure = ai_model.with_structured_output(SectionsStructureContainer, method=STRUCTURED_OUTPUT_METHOD)
+    payload = {
         "topic": state.topic,
         "purpose": state.purpose,
         "target_audience": state.target_audience,
         "tone": state.tone,
         "goal": state.goal,
         "max_sections": 3 # delete later
-    })
-    system_message = AIMessage(content=long_form_video_structure_generation_system_prompt)
-    user_message = HumanMessage(content=payload)
-    messages = [system_message, user_message]
-    sections_structure_container: BaseModel = model_for_sections_structure.invoke(messages)
+    }
+    sections_structure_container: BaseModel = invoke_with_response_cache(
+        model_for_sections_structure, "long_form_structure", payload,
+        lambda: build_messages(PROMPTS["long_form_structure"], payload), REPLAY_TTL_SECONDS)
     return {"sections_structure_list": [section_structure for section_structure in sections_structure_container.sections_structure_list]}
 
 
@@ -277,13 +257,13 @@ def generate_section_scripts(state: AgentState) -> dict[str, str]:
     """
     if state.debug_mode:
         print("Generating script...")
-    model_for_section_script = ai_model.with_structured_output(SectionScriptContainer)
+    model_for_section_script = ai_model.with_structured_output(SectionScriptContainer, method=STRUCTURED_OUTPUT_METHOD)
     cumulative_script = ""
     section_scripts = []
     num_of_sections = len(state.sections_structure_list) + 1
     for index, section_structure in enumerate(state.sections_structure_list):
         print(f"Generating script for section {index+1} of {num_of_sections}...")
-        payload = json.dumps({
+        payload = {
             "topic": state.topic,
             "purpose": state.purpose,
             "target_audience": state.target_audience,
@@ -297,10 +277,11 @@ def generate_section_scripts(state: AgentState) -> dict[str, str]:
                 "section_directives": section_structure.section_directives,
                 "section_talking_points": section_structure.section_talking_points,
             }
-        })
-        system_message = SystemMessage(content=long_form_video_topic_section_script_generation_system_prompt)
-        user_message = HumanMessage(content=payload)
-        messages = [system_message, user_message]
+        }
+        # the cumulative script only ever grows, so keeping it ahead of the current section's details lets each call
+        # reuse the previous call's prefix
+        messages = build_messages(PROMPTS["long_form_section_script"], payload,
+                                  per_call_keys=("cumulative_script", "section_information"))
         section_script_container = model_for_section_script.invoke(messages)
         cumulative_script += section_script_container.section_script
         section_scripts.append(section_script_container.section_script)
@@ -319,16 +300,9 @@ def enhance_script_for_audio_generation(state: AgentState) -> dict[str, str]:
     """
     if state.debug_mode:
         print("Enhancing script for audio generation...")
-    model_for_enhanced_script = ai_model.with_structured_output(EnhancedScriptContainer)
-    payload = json.dumps({
-        "script": state.script,
-    })
-
-    system_message = SystemMessage(content=script_enhancer_elevenlabs_v3_system_prompt)
-    user_message = HumanMessage(content=payload)
-    messages = [system_message, user_message]
-    enhanced_script_container: BaseModel = model_for_enhanced_script.invoke(messages)
-    return {"enhanced_script": enhanced_script_container.model_dump().get("enhanced_script", "")}
+    model_for_enhanced_script = ai_model.with_structured_output(EnhancedScriptContainer, method=STRUCTURED_OUTPUT_METHOD)
+    enhanced_script = enhance_script_selectively(model_for_enhanced_script, state.script)
+    return {"enhanced_script": enhanced_script}
 
 # semi done
 def segment_section_scripts(state: AgentState) -> dict[str, list[list[SectionScriptSegmentItem]]]:
@@ -350,14 +324,12 @@ def segment_section_scripts(state: AgentState) -> dict[str, list[list[SectionScr
     all_sections_scripts_as_lists: list[list[SectionScriptSegmentItem]] = []
     for index, section_script in enumerate(state.section_scripts):
         print(f"Segmenting script for section_script: index:{index}, script:{section_script}")
-        model_for_segmenting_script_segments = ai_model.with_structured_output(SectionScriptSegmentedContainer)
-        payload = json.dumps({
+        model_for_segmenting_script_segments = ai_model.with_structured_output(SectionScriptSegmentedContainer, method=STRUCTURED_OUTPUT_METHOD)
+        payload = {
             "section_script": section_script
-        })
+        }
         # SectionScriptSegmentItem
-        system_message = SystemMessage(content=long_form_video_section_script_segmenter_system_prompt)
-        user_message = HumanMessage(content=payload)
-        messages = [system_message, user_message]
+        messages = build_messages(PROMPTS["long_form_section_segmenter"], payload)
         section_script_segmented_container = model_for_segmenting_script_segments.invoke(messages)
         # section_script_segmented_container is a class with a key section_script_segmented_as_list`
         # section_script_segmented_as_list is a list of `section_script_segment_item`
@@ -573,7 +545,7 @@ async def generate_segments_image_descriptions(state: AgentState) -> dict[str, l
     all_sections_image_descriptions_container_for_all_segments = []
     all_sections_segments_last_image_durations = []
 
-    model_for_segment_image_descriptions = ai_model.with_structured_output(SegmentImageDescriptionsContainer)
+    model_for_segment_image_descriptions = ai_model.with_structured_output(SegmentImageDescriptionsContainer, method=STRUCTURED_OUTPUT_METHOD)
 
     for section_index, section_script_segmented_as_list in enumerate(state.all_sections_scripts_as_lists):
         section_tasks = []
@@ -592,7 +564,7 @@ async def generate_segments_image_descriptions(state: AgentState) -> dict[str, l
                 segments_in_section_last_image_durations.append(last_image_duration)
 
                 # Construct payload to create image descriptions for a segment
-                payload = json.dumps({
+                payload = {
                     "script_segment": state.all_sections_scripts_as_lists[section_index][segment_in_section_script_index].section_script_segment,
                     "full_script": state.section_scripts[section_index],
                     "additional_image_requests": state.additional_image_requests,
@@ -600,10 +572,9 @@ async def generate_segments_image_descriptions(state: AgentState) -> dict[str, l
                     "topic": state.topic,
                     "tone": state.tone,
                     "num_of_image_descriptions": num_of_images_per_segment
-                })
-                system_message = SystemMessage(content=generate_segment_image_descriptions_system_prompt)
-                user_message = HumanMessage(content=payload)
-                messages = [system_message, user_message]
+                }
+                messages = build_messages(PROMPTS["segment_image_descriptions"], payload,
+                                          per_call_keys=("num_of_image_descriptions", "script_segment"))
                 section_tasks.append(t.create_task(asyncio.to_thread(model_for_segment_image_descriptions.invoke, messages)))
 
         # this a list container (container = dictionary) with a key "segment_image_descriptions". For each dictionary, the value of this key
@@ -0,0 +1,18 @@
+import json
+
+from pydantic import BaseModel, Field
+
+
+# Structured-output containers whose JSON Schema is embedded in a system prompt. They live here, rather than next to
+# the pipeline that parses them, so system_prompts.py can build complete prompts from them without a circular import.
+class SectionStructure(BaseModel):
+    section_name: str = Field(..., description="A descriptive name for the section.")
+    section_purpose: str = Field(..., description="The purpose of the section in paragraph format explaining the strategic function of it.")
+    section_directives: list[str] = Field(..., description="A list of directives that define the section's purpose.")
+    section_talking_points: list[str] = Field(..., description="A list of talking points that will be discussed within this section.")
+
+class SectionsStructureContainer(BaseModel):
+    sections_structure_list: list[SectionStructure] = Field(..., description="A list of section structures for the video.")
+
+# compact schema string, computed once at import
+SECTIONS_STRUCTURE_SCHEMA_JSON = json.dumps(SectionsStructureContainer.model_json_schema(), separators=(",", ":"))
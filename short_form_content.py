@@ -4,29 +4,22 @@ import os
 import uuid
 from pprint import pprint
 from typing import Optional, Literal, Union
-import json
 from pathlib import Path
 import asyncio
 from datetime import datetime
 # third party packages
 import ffmpeg
-from langchain.messages import HumanMessage, SystemMessage
 from langgraph.graph import StateGraph
 from langgraph.constants import START, END
 from pydantic import BaseModel, Field
 from langchain.chat_models import init_chat_model
 from elevenlabs import ElevenLabs
 # my modules
-from system_prompts import (
-    short_form_video_goal_generation_system_prompt,
-    short_form_video_hook_generation_system_prompt,
-    short_form_script_generation_system_prompt,
-    script_enhancer_elevenlabs_v3_system_prompt, script_segmentation_system_prompt,
-    image_descriptions_generator_system_prompt, generate_segment_image_descriptions_system_prompt, gemini_3_short_form_script_generation_system_prompt,
-)
+from system_prompts import PROMPTS, system_prompt_with_examples
 from utils import generate_image, animate_with_motion_effect
 from utils import model_providers, image_models, image_styles, voice_model_versions, voice_models, voice_actors
-from utils import get_video_duration
+from utils import STRUCTURED_OUTPUT_METHOD, REPLAY_TTL_SECONDS, build_messages, invoke_with_response_cache, get_video_duration
+from utils import enhance_script_selectively, segment_script_deterministically
 from dotenv import load_dotenv
 from aiolimiter import AsyncLimiter
 from concurrent.futures import ProcessPoolExecutor
@@ -42,6 +35,10 @@ ai_model = init_chat_model(model_provider="google-genai", model="gemini-2.5-pro"
 # ai_model = init_chat_model(model_provider="openai", model="")
 # ai_model = init_chat_model(model_provider="xai", model="grok-4-latest")
 USING_GEMINI_3 = False
+# segment the script with the script_segmentation LLM prompt instead of the deterministic splitter in utils
+USE_LLM_SCRIPT_SEGMENTATION = False
+# generate the goal, hook and script in one LLM call instead of three sequential ones
+FUSE_GOAL_HOOK_AND_SCRIPT = True
 
 # ai_model = init_chat_model(model_provider="openai", model="gpt-5.2")
 
@@ -61,6 +58,11 @@ class HookContainer(BaseModel):
 class ScriptContainer(BaseModel):
     script: str = Field(..., description="The script for the video to be produced.")
 
+class GoalHookScriptContainer(BaseModel):
+    goal: str = Field(..., description="The goal of the video to be produced.")
+    hook: str = Field(..., description="The hook of the video to be produced.")
+    script: str = Field(..., description="The script for the video to be produced.")
+
 class EnhancedScriptContainer(BaseModel):
     enhanced_script: str = Field(..., description="The enhanced script to be used for audio generation.")
 
@@ -167,21 +169,16 @@ def generate_goal(state: AgentState) -> dict[str, str]:
     """
     if state.debug_mode:
         print("Generating goal...")
-    model_for_goal = ai_model.with_structured_output(GoalContainer)
-    payload = json.dumps({
+    model_for_goal = ai_model.with_structured_output(GoalContainer, method=STRUCTURED_OUTPUT_METHOD)
+    payload = {
         "topic": state.topic,
         "purpose": state.purpose,
         "target_audience": state.target_audience,
-    })
-    if USING_GEMINI_3:
-        user_message = HumanMessage(content=short_form_video_goal_generation_system_prompt + "The payload is sa follows: \n" + payload)
-        messages = [user_message]
-    else:
-        system_message = SystemMessage(content=short_form_video_goal_generation_system_prompt)
-        user_message = HumanMessage(content=payload)
-        messages = [system_message, user_message]
+    }
 
-    goal_container: BaseModel = model_for_goal.invoke(messages)
+    goal_container: BaseModel = invoke_with_response_cache(
+        model_for_goal, "goal", payload,
+        lambda: build_messages(system_prompt_with_examples("goal", payload), payload, inline_system_prompt=USING_GEMINI_3))
     return {"goal": goal_container.goal}
 
 def generate_hook(state: AgentState) -> dict[str, str]:
@@ -196,24 +193,19 @@ def generate_hook(state: AgentState) -> dict[str, str]:
     """
     if state.debug_mode:
         print("Generating hook...")
-    model_for_hook = ai_model.with_structured_output(HookContainer)
-    payload = json.dumps({
+    model_for_hook = ai_model.with_structured_output(HookContainer, method=STRUCTURED_OUTPUT_METHOD)
+    payload = {
         "topic": state.topic,
         "purpose": state.purpose,
         "target_audience": state.target_audience,
         "tone": state.tone,
         "platform": state.platform,
-    })
+    }
 
-    if USING_GEMINI_3:
-        user_message = HumanMessage(content=short_form_video_hook_generation_system_prompt + "The payload is as follows: \n" + payload)
-        messages = [user_message]
-    else:
-        user_message = HumanMessage(content=payload)
-        system_message = SystemMessage(content=short_form_video_hook_generation_system_prompt)
-        messages = [system_message, user_message]
 
-    hook_container: BaseModel = model_for_hook.invoke(messages)
+    hook_container: BaseModel = invoke_with_response_cache(
+        model_for_hook, "hook", payload,
+        lambda: build_messages(system_prompt_with_examples("hook", payload), payload, inline_system_prompt=USING_GEMINI_3))
     return {"hook": hook_container.hook}
 
 
@@ -229,8 +221,8 @@ def generate_script(state: AgentState) -> dict[str, str]:
     """
     if state.debug_mode:
         print("Generating script...")
-    model_for_script = ai_model.with_structured_output(ScriptContainer)
-    payload = json.dumps({
+    model_for_script = ai_model.with_structured_output(ScriptContainer, method=STRUCTURED_OUTPUT_METHOD)
+    payload = {
         "topic": state.topic,
         "goal": state.goal,
         "hook": state.hook,
@@ -241,21 +233,44 @@ def generate_script(state: AgentState) -> dict[str, str]:
         "platform": "Instagram and Tiktok",
         "duration_seconds": state.duration_seconds,
         "style_reference": state.style_reference,
-    })
-    if USING_GEMINI_3:
-        user_message = HumanMessage(content=short_form_script_generation_system_prompt + "The payload is as follows: \n" + payload)
-        messages = [user_message]
-    else:
-        user_message = HumanMessage(content=payload)
-        system_message = SystemMessage(content=short_form_script_generation_system_prompt)
-        messages = [system_message, user_message]
-    print(messages)
-    script_container: BaseModel = model_for_script.invoke(messages)
+    }
+    script_container: BaseModel = invoke_with_response_cache(
+        model_for_script, "script", payload,
+        lambda: build_messages(PROMPTS["script"], payload, inline_system_prompt=USING_GEMINI_3), REPLAY_TTL_SECONDS)
 
     print(type(script_container))
     print(script_container.model_dump())
     return {"script": script_container.model_dump().get("script", "")}
 
+def generate_goal_hook_and_script(state: AgentState) -> dict[str, str]:
+    """
+        This function generates the goal, hook and script of the video in a single LLM call, using a prompt that chains
+        the three individual prompts. It is used in place of `generate_goal`, `generate_hook` and `generate_script` when
+        FUSE_GOAL_HOOK_AND_SCRIPT is set. It returns a dictionary with `goal`, `hook` and `script` keys.
+        Parameters:
+            state (AgentState): The current state of the agent.
+        Returns:
+            dict[str, str]: Dictionary containing the goal, hook and script for the video
+    """
+    if state.debug_mode:
+        print("Generating goal, hook and script...")
+    model_for_goal_hook_and_script = ai_model.with_structured_output(GoalHookScriptContainer, method=STRUCTURED_OUTPUT_METHOD)
+    payload = {
+        "topic": state.topic,
+        "purpose": state.purpose,
+        "target_audience": state.target_audience,
+        "tone": state.tone,
+        "platform": state.platform,
+        "additional_requests": state.additional_instructions,
+        "duration_seconds": state.duration_seconds,
+        "style_reference": state.style_reference,
+    }
+    goal_hook_script_container: BaseModel = invoke_with_response_cache(
+        model_for_goal_hook_and_script, "goal_hook_script", payload,
+        lambda: build_messages(PROMPTS["goal_hook_script"], payload, inline_system_prompt=USING_GEMINI_3),
+        REPLAY_TTL_SECONDS)
+    return goal_hook_script_container.model_dump()
+
 def enhance_script_for_audio_generation(state: AgentState) -> dict[str, str]:
     """
         This function enhances the script for the audio generation of the video. it does by adding SSML(speech synthesis
@@ -267,20 +282,9 @@ def enhance_script_for_audio_generation(state: AgentState) -> dict[str, str]:
     """
     if state.debug_mode:
         print("Enhancing script for audio generation...")
-    model_for_enhanced_script = ai_model.with_structured_output(EnhancedScriptContainer)
-    payload = json.dumps({
-        "script": state.script,
-    })
-    if USING_GEMINI_3:
-        user_message = HumanMessage(content=script_enhancer_elevenlabs_v3_system_prompt + "The payload is as follows: \n" + payload)
-        messages = [user_message]
-    else:
-        system_message = SystemMessage(content=script_enhancer_elevenlabs_v3_system_prompt)
-        user_message = HumanMessage(content=payload)
-        messages = [system_message, user_message]
-
-    enhanced_script_container: BaseModel = model_for_enhanced_script.invoke(messages)
-    return {"enhanced_script": enhanced_script_container.model_dump().get("enhanced_script", "")}
+    model_for_enhanced_script = ai_model.with_structured_output(EnhancedScriptContainer, method=STRUCTURED_OUTPUT_METHOD)
+    enhanced_script = enhance_script_selectively(model_for_enhanced_script, state.script, inline_system_prompt=USING_GEMINI_3)
+    return {"enhanced_script": enhanced_script}
 
 def segment_script(state: AgentState) -> dict[str, list[dict[str, str]]]:
     """
@@ -295,18 +299,18 @@ def segment_script(state: AgentState) -> dict[str, list[dict[str, str]]]:
     """
     if state.debug_mode:
         print("Segmenting script...")
-    model_for_script_list = ai_model.with_structured_output(ScriptListContainer)
-    payload = json.dumps({
+    if not USE_LLM_SCRIPT_SEGMENTATION:
+        script_list = segment_script_deterministically(state.script, state.enhanced_script)
+        if script_list is not None:
+            return {"script_list": script_list}
+        if state.debug_mode:
+            print("Script tracks could not be aligned, falling back to the LLM segmenter...")
+    model_for_script_list = ai_model.with_structured_output(ScriptListContainer, method=STRUCTURED_OUTPUT_METHOD)
+    payload = {
         "script": state.script,
         "enhanced_script": state.enhanced_script,
-    })
-    if USING_GEMINI_3:
-        user_message = HumanMessage(content=script_segmentation_system_prompt + "The payload is as follows: \n" + payload)
-        messages = [user_message]
-    else:
-        system_message = SystemMessage(content=script_segmentation_system_prompt)
-        user_message = HumanMessage(content=payload)
-        messages = [system_message, user_message]
+    }
+    messages = build_messages(PROMPTS["script_segmentation"], payload, inline_system_prompt=USING_GEMINI_3)
 
     script_list_container: BaseModel = model_for_script_list.invoke(messages)
     # print(script_list_container)
@@ -467,7 +471,7 @@ async def generate_segments_image_descriptions(state: AgentState) -> dict[str, l
     """"""
     if state.debug_mode:
         print("Generating segment image descriptions...")
-    model_for_segment_image_descriptions = ai_model.with_structured_output(SegmentImageDescriptionsContainer)
+    model_for_segment_image_descriptions = ai_model.with_structured_output(SegmentImageDescriptionsContainer, method=STRUCTURED_OUTPUT_METHOD)
     tasks = []
     last_image_durations: list[float] = []
     try:
@@ -483,7 +487,7 @@ async def generate_segments_image_descriptions(state: AgentState) -> dict[str, l
                 last_image_durations.append(last_image_duration)
 
                 # Construct payload to create image descriptions for a segment
-                payload = json.dumps({
+                payload = {
                     "script_segment": state.script_list[index]["script_segment"],
                     "full_script": state.script,
                     "additional_image_requests": state.additional_image_requests,
@@ -491,15 +495,11 @@ async def generate_segments_image_descriptions(state: AgentState) -> dict[str, l
                     "topic": state.topic,
                     "tone": state.tone,
                     "num_of_image_descriptions": num_of_images_per_segment
-                })
+                }
 
-                if USING_GEMINI_3:
-                    user_message = HumanMessage(content=generate_segment_image_descriptions_system_prompt + "The payload is: \n:" + payload)
-                    messages = [user_message]
-                else:
-                    system_message = SystemMessage(content=generate_segment_image_descriptions_system_prompt)
-                    user_message = HumanMessage(content=payload)
-                    messages = [system_message, user_message]
+                messages = build_messages(PROMPTS["segment_image_descriptions"], payload,
+                                          per_call_keys=("num_of_image_descriptions", "script_segment"),
+                                          inline_system_prompt=USING_GEMINI_3)
 
                 task = t.create_task(asyncio.to_thread(model_for_segment_image_descriptions.invoke, messages))
                 if state.debug_mode:
@@ -832,9 +832,12 @@ def debug_graph(state: AgentState):
 graph_builder = StateGraph(AgentState)
 # Node definitions
 graph_builder.add_node("resolve_state_values", resolve_agent_state_values)
-graph_builder.add_node("generate_goal", generate_goal)
-graph_builder.add_node("generate_hook", generate_hook)
-graph_builder.add_node("generate_script", generate_script)
+if FUSE_GOAL_HOOK_AND_SCRIPT:
+    graph_builder.add_node("generate_goal_hook_and_script", generate_goal_hook_and_script)
+else:
+    graph_builder.add_node("generate_goal", generate_goal)
+    graph_builder.add_node("generate_hook", generate_hook)
+    graph_builder.add_node("generate_script", generate_script)
 graph_builder.add_node("enhance_script", enhance_script_for_audio_generation)
 graph_builder.add_node("generate_audio", generate_audio)
 graph_builder.add_node("segment_script", segment_script)
@@ -846,10 +849,14 @@ graph_builder.add_node("assemble_final_video", assemble_final_video)
 graph_builder.add_node("debug_graph", debug_graph)
 # Edge definitions
 graph_builder.add_edge(START, "resolve_state_values")
-graph_builder.add_edge("resolve_state_values", "generate_goal")
-graph_builder.add_edge("generate_goal", "generate_hook")
-graph_builder.add_edge("generate_hook", "generate_script")
-graph_builder.add_edge("generate_script", "enhance_script")
+if FUSE_GOAL_HOOK_AND_SCRIPT:
+    graph_builder.add_edge("resolve_state_values", "generate_goal_hook_and_script")
+    graph_builder.add_edge("generate_goal_hook_and_script", "enhance_script")
+else:
+    graph_builder.add_edge("resolve_state_values", "generate_goal")
+    graph_builder.add_edge("generate_goal", "generate_hook")
+    graph_builder.add_edge("generate_hook", "generate_script")
+    graph_builder.add_edge("generate_script", "enhance_script")
 graph_builder.add_edge("enhance_script", "segment_script")
 graph_builder.add_edge("segment_script", "generate_audio")
 graph_builder.add_edge("generate_audio", "calculate_script_segment_durations")
@@ -1,17 +1,33 @@
+import contextlib
+import difflib
+import functools
+import hashlib
+import random
+import re
+import shutil
+import tempfile
+import threading
 import time
+import uuid
+import weakref
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Literal, Union
+from typing import Callable, Literal, Mapping, Union
 from google import genai
 from google.genai import types
 import os
 
 from langchain.chat_models import init_chat_model
-from langchain.messages import AIMessage, HumanMessage
+from langchain.messages import HumanMessage, SystemMessage
+from langchain_core.messages import BaseMessage
+from langchain_core.runnables import Runnable
 from pydantic import BaseModel, Field
 from openai import OpenAI
 import base64
+import json
 import ffmpeg
-from system_prompts import topics_extractor_system_prompt
+from system_prompts import PROMPTS
 import requests as r
 import asyncio
 from typing import Optional
@@ -23,6 +39,9 @@ class TopicsContainer(BaseModel):
     topics: list[str] = Field(..., description="List of topic extracted from the text.")
 
 ai_model = init_chat_model(model_provider="google-genai", model="gemini-2.5-pro")
+# pass the container's JSON Schema to the provider so the reply is constrained while decoding, instead of relying on
+# output-format prose in the prompts and retrying on malformed JSON
+STRUCTURED_OUTPUT_METHOD = "json_schema"
 
 # Enums
 model_providers = Literal["google", "openai", "claude", "xai", "deepseek"]
@@ -58,38 +77,173 @@ voice_actors = Literal[
 from aiolimiter import AsyncLimiter
 import asyncio
 
-class LoopBoundLimits:
-    def __init__(self):
-        self._loop = None
-
-        self.google_limiter = None
-        self.openai_limiter = None
-        self.flux_limiter = None
+# image providers' request budgets as (requests, per seconds). AdaptiveLimiter starts from these and then follows the
+# rate-limit headers the providers send back
+RATE_LIMIT_PROFILES = {
+    "google": (1, 9),
+    "openai": (1, 9),
+    "flux": (1, 9),
+}
 
-        self.google_sem = None
-        self.openai_sem = None
-        self.flux_sem = None
+class AdaptiveLimiter:
+    """
+    A token-bucket limiter (AsyncLimiter) that also reacts to the provider's rate-limit headers. `record_response`
+    reads `Retry-After` and the remaining/limit request counters; when the provider asks to wait, or fewer than
+    `low_remaining_fraction` of the window's requests remain, every later acquire waits until the window resets.
+    """
+    _REMAINING_HEADERS = ("x-ratelimit-remaining-requests", "anthropic-ratelimit-requests-remaining")
+    _LIMIT_HEADERS = ("x-ratelimit-limit-requests", "anthropic-ratelimit-requests-limit")
+    _RESET_HEADERS = ("x-ratelimit-reset-requests",)
+    _DURATION_PART_RE = re.compile(r"(\d+(?:\.\d+)?)(ms|s|m|h)")
+    _DURATION_UNIT_SECONDS = {"ms": 0.001, "s": 1, "m": 60, "h": 3600}
+
+    def __init__(self, max_rate: float, time_period: float, low_remaining_fraction: float = 0.1):
+        self._limiter = AsyncLimiter(max_rate=max_rate, time_period=time_period)
+        self._time_period = time_period
+        self._low_remaining_fraction = low_remaining_fraction
+        self._paused_until = 0.0
+
+    async def __aenter__(self) -> None:
+        pause_seconds = self._paused_until - time.monotonic()
+        if pause_seconds > 0:
+            await asyncio.sleep(pause_seconds)
+        await self._limiter.acquire()
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        return None
 
-    def ensure(self):
-        loop = asyncio.get_running_loop()
-        if self._loop is loop:
+    def _parse_seconds(self, value: Optional[str]) -> Optional[float]:
+        # accepts both plain seconds ("7", "0.5") and OpenAI-style durations ("1m30s", "250ms")
+        if value is None:
+            return None
+        try:
+            return float(value)
+        except ValueError:
+            parts = self._DURATION_PART_RE.findall(value)
+            return sum(float(amount) * self._DURATION_UNIT_SECONDS[unit] for amount, unit in parts) if parts else None
+
+    def record_response(self, headers: Optional[Mapping[str, str]]) -> None:
+        """
+        Updates the limiter from the headers of a provider response.
+        Parameters:
+            headers (Optional[Mapping[str, str]]): The response headers; None is ignored.
+        """
+        if not headers:
             return
+        headers = {key.lower(): value for key, value in headers.items()}
+        pause_seconds = self._parse_seconds(headers.get("retry-after"))
 
-        # loop changed (or first time) -> rebuild everything
-        self._loop = loop
+        remaining = next((headers[name] for name in self._REMAINING_HEADERS if name in headers), None)
+        limit = next((headers[name] for name in self._LIMIT_HEADERS if name in headers), None)
+        if remaining is not None and limit is not None and remaining.isdigit() and limit.isdigit() and int(limit) > 0:
+            if int(remaining) / int(limit) < self._low_remaining_fraction:
+                reset_seconds = self._parse_seconds(next((headers[name] for name in self._RESET_HEADERS
+                                                          if name in headers), None))
+                pause_seconds = max(pause_seconds or 0.0, reset_seconds or self._time_period)
 
-        rate = 1
-        period = 9  # your current math
+        if pause_seconds:
+            self._paused_until = max(self._paused_until, time.monotonic() + pause_seconds)
 
-        self.google_limiter = AsyncLimiter(max_rate=rate, time_period=period)
-        self.openai_limiter  = AsyncLimiter(max_rate=rate, time_period=period)
-        self.flux_limiter    = AsyncLimiter(max_rate=rate, time_period=period)
-
-        self.google_sem = asyncio.Semaphore(8)
-        self.openai_sem = asyncio.Semaphore(8)
-        self.flux_sem   = asyncio.Semaphore(5)
+class DynamicSemaphore:
+    """
+    A semaphore whose capacity follows provider health (AIMD): each call that finishes within twice the recent average
+    latency adds 0.5 to the capacity, and each failed, throttled or unusually slow call halves it, within
+    [min_capacity, max_capacity]. Used as `async with`, which also times the call, so it should only wrap one kind of
+    call: the latency window assumes every sample costs about the same.
 
-limits = LoopBoundLimits()
+    is_overload_error, when given, decides which exceptions signal an overloaded provider. Any other exception is
+    released without touching the capacity or the latency window, since a rejected request says nothing about load.
+    """
+    LATENCY_WINDOW_SIZE = 20
+    LATENCY_SPIKE_FACTOR = 2.0
+
+    def __init__(self, initial_capacity: int, min_capacity: int = 1, max_capacity: int = 16,
+                 is_overload_error: Optional[Callable[[BaseException], bool]] = None):
+        self._capacity = float(initial_capacity)
+        self._min_capacity = min_capacity
+        self._max_capacity = max_capacity
+        self._is_overload_error = is_overload_error
+        self._in_flight = 0
+        self._condition = asyncio.Condition()
+        self._latencies: deque[float] = deque(maxlen=self.LATENCY_WINDOW_SIZE)
+        # holders are timed per task, since several tasks hold the semaphore at once
+        self._started_at: dict[asyncio.Task, float] = {}
+
+    @property
+    def capacity(self) -> int:
+        return int(self._capacity)
+
+    async def __aenter__(self) -> None:
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._in_flight < self.capacity)
+            self._in_flight += 1
+        self._started_at[asyncio.current_task()] = time.monotonic()
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        latency = time.monotonic() - self._started_at.pop(asyncio.current_task())
+        if exc_type is not None:
+            if self._is_overload_error is None or self._is_overload_error(exc):
+                self.on_error()
+        else:
+            self.on_success(latency)
+        async with self._condition:
+            self._in_flight -= 1
+            self._condition.notify_all()
+
+    def on_success(self, latency: float) -> None:
+        average_latency = sum(self._latencies) / len(self._latencies) if self._latencies else latency
+        self._latencies.append(latency)
+        if latency > average_latency * self.LATENCY_SPIKE_FACTOR:
+            self.on_error()
+        else:
+            self._capacity = min(self._max_capacity, self._capacity + 0.5)
+
+    def on_error(self) -> None:
+        self._capacity = max(self._min_capacity, self._capacity * 0.5)
+
+def _is_http_overload_error(exc: BaseException) -> bool:
+    """True for a 429 or 5xx response raised by raise_for_status()."""
+    response = getattr(exc, "response", None) if isinstance(exc, r.HTTPError) else None
+    return response is not None and (response.status_code == 429 or response.status_code >= 500)
+
+# concurrent BFL status polls and image downloads per loop
+FLUX_TRANSFER_CONCURRENCY = 10
+
+# limiters and semaphores bind to the event loop they're first awaited on, so each loop gets its own set. Kept per loop
+# (rather than rebuilt whenever the running loop changes) so two pages running their own loops in different Streamlit
+# threads don't keep resetting each other's limits, and a loop's lookup after the first call is a single dict read
+class LoopBoundLimits:
+    def __init__(self):
+        self.google_limiter = AdaptiveLimiter(*RATE_LIMIT_PROFILES["google"])
+        self.openai_limiter = AdaptiveLimiter(*RATE_LIMIT_PROFILES["openai"])
+        self.flux_limiter = AdaptiveLimiter(*RATE_LIMIT_PROFILES["flux"])
+
+        self.google_sem = DynamicSemaphore(8)
+        self.openai_sem = DynamicSemaphore(8)
+        # only BFL job submissions go through the AIMD semaphore. Polls and downloads take very different times from a
+        # submit, and timing them in the same window made every submit and download look like a latency spike, so
+        # they share a fixed cap instead
+        self.flux_sem   = DynamicSemaphore(5, max_capacity=10, is_overload_error=_is_http_overload_error)
+        self.flux_transfer_sem = asyncio.Semaphore(FLUX_TRANSFER_CONCURRENCY)
+
+# weak keys, so a loop that's closed and dropped (each batch on the multiple video page makes a new one) takes its
+# limits with it
+_limits_by_loop: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, LoopBoundLimits]" = weakref.WeakKeyDictionary()
+
+def get_limits() -> LoopBoundLimits:
+    loop = asyncio.get_running_loop()
+    loop_limits = _limits_by_loop.get(loop)
+    if loop_limits is None:
+        loop_limits = _limits_by_loop[loop] = LoopBoundLimits()
+    return loop_limits
+
+# blocking provider calls (image generation, BFL submit/poll/download) run on their own pool, wide enough for every
+# provider's semaphore at its usual capacity, so a batch of slow generations never starves the default executor the file writes use. Submitted
+# with run_in_executor directly: nothing here reads context variables, so to_thread's per-call context copy is wasted
+PROVIDER_EXECUTOR = ThreadPoolExecutor(max_workers=32, thread_name_prefix="image-provider")
+
+async def run_provider_call(func: Callable, *args):
+    return await asyncio.get_running_loop().run_in_executor(PROVIDER_EXECUTOR, func, *args)
 
 
 # google_image_generation_limiter = AsyncLimiter(max_rate=1, time_period=60/9)
@@ -99,9 +253,25 @@ limits = LoopBoundLimits()
 # google_image_generation_semaphore = asyncio.Semaphore(8)
 # openai_image_generation_semaphore = asyncio.Semaphore(8)
 
-async def generate_image_with_flux(prompt: str, orientation: str) -> Optional[bytes]:
-    def _generate_image_with_flux(_prompt: str, _orientation: str) ->Optional[bytes]:
-        api_response = r.post(
+# BFL job polling: start slow, since most jobs take several seconds, then poll more often as the job nears completion
+FLUX_POLL_INITIAL_DELAY_SECONDS = 2.0
+FLUX_POLL_MIN_DELAY_SECONDS = 0.5
+FLUX_POLL_DELAY_DECAY = 0.85
+FLUX_POLL_JITTER = 0.2
+FLUX_POLL_TIMEOUT_SECONDS = 120
+
+# one keep-alive session for every BFL call (submit, polls, download), so each image reuses pooled connections instead
+# of opening a fresh TCP+TLS connection per request. The API key is sent per request rather than set on the session,
+# so it never reaches the image delivery host
+@functools.cache
+def _get_flux_session() -> r.Session:
+    flux_session = r.Session()
+    flux_session.mount("https://", r.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=16))
+    return flux_session
+
+async def generate_image_with_flux(prompt: str, orientation: str, image_path: Path) -> bool:
+    def _submit_flux_job(_prompt: str, _orientation: str) -> str:
+        api_response = _get_flux_session().post(
             "https://api.bfl.ai/v1/flux-2-pro",
             headers={
                 "accept": "application/json",
@@ -114,40 +284,78 @@ async def generate_image_with_flux(prompt: str, orientation: str) -> Optional[by
                 "height": 1920 if _orientation == "portrait" else 1088,
             },
         )
+        limits.flux_limiter.record_response(api_response.headers)
         api_response.raise_for_status()
-        json_response = api_response.json()
-        polling_url = json_response["polling_url"]
-        image_url = ""
-        while True:
-            result = r.get(
-                polling_url,
-                headers={"accept": "application/json", "x-key": os.environ.get("BFL_API_KEY")}
-            ).json()
-
-            if result["status"] == "Ready":
-                image_url = result["result"]["sample"]
-                print(f"Image URL: {result['result']['sample']}")
-                break
-            elif result["status"] == "Failed":
-                print(f"Error: {result['error']}")
-                break
-
-            time.sleep(0.5)
-
-        if image_url:
-            image_response = r.get(image_url, timeout=20)
+        return api_response.json()["polling_url"]
+
+    def _poll_flux_job(_polling_url: str) -> r.Response:
+        return _get_flux_session().get(_polling_url,
+                                       headers={"accept": "application/json", "x-key": os.environ.get("BFL_API_KEY")})
+
+    # streamed straight into the output file in chunks, so the full PNG is never held in memory (once per concurrent
+    # download) or copied from the response buffer into a bytes object first
+    def _download_flux_image(_image_url: str, _image_path: Path) -> None:
+        with _get_flux_session().get(_image_url, stream=True, timeout=20) as image_response:
             image_response.raise_for_status()
-            return image_response.content
-        return None
-    limits.ensure()
+            with open(_image_path, "wb") as image_file:
+                for chunk in image_response.iter_content(chunk_size=65536):
+                    image_file.write(chunk)
+
+    limits = get_limits()
+    # the limiter and semaphores only gate the HTTP calls themselves, never the waits between polls, so a long job does
+    # not hold a slot while it renders. Only submissions count against the rate limit and size the AIMD semaphore;
+    # polls are cheap status reads
     async with limits.flux_sem:
         async with limits.flux_limiter:
-            return await asyncio.to_thread(_generate_image_with_flux, prompt, orientation)
-
+            polling_url = await run_provider_call(_submit_flux_job, prompt, orientation)
+
+    image_url = ""
+    delay = FLUX_POLL_INITIAL_DELAY_SECONDS
+    deadline = time.monotonic() + FLUX_POLL_TIMEOUT_SECONDS
+    while time.monotonic() < deadline:
+        await asyncio.sleep(delay * random.uniform(1 - FLUX_POLL_JITTER, 1 + FLUX_POLL_JITTER))
+        async with limits.flux_transfer_sem:
+            poll_response = await run_provider_call(_poll_flux_job, polling_url)
+        limits.flux_limiter.record_response(poll_response.headers)
+        # a throttled poll carries no job status; just back off and try again
+        result = poll_response.json() if poll_response.status_code != 429 else {"status": "Throttled"}
+
+        if result["status"] == "Ready":
+            image_url = result["result"]["sample"]
+            print(f"Image URL: {result['result']['sample']}")
+            break
+        elif result["status"] == "Failed":
+            print(f"Error: {result['error']}")
+            break
+
+        retry_after = poll_response.headers.get("Retry-After")
+        if retry_after is not None and retry_after.replace(".", "", 1).isdigit():
+            delay = float(retry_after)
+        else:
+            delay = max(FLUX_POLL_MIN_DELAY_SECONDS, delay * FLUX_POLL_DELAY_DECAY)
+    else:
+        print(f"Error: Flux job did not finish within {FLUX_POLL_TIMEOUT_SECONDS} seconds")
+
+    if image_url:
+        async with limits.flux_transfer_sem:
+            await run_provider_call(_download_flux_image, image_url, image_path)
+        return True
+    return False
+
+
+# SDK clients are built once per process and shared, so their connection pools (and TLS sessions) are reused across
+# images instead of being rebuilt for every call. Built lazily so a missing optional key only fails when it's needed
+@functools.cache
+def _get_gemini_client() -> genai.Client:
+    return genai.Client(api_key=os.environ["GOOGLE_API_KEY"])
+
+@functools.cache
+def _get_openai_client() -> OpenAI:
+    return OpenAI(api_key=os.environ["OPENAI_API_KEY"])
 
 async def generate_image_with_gemini(prompt: str, orientation: str) -> Optional[bytes]:
     def _generate_image_with_gemini(_prompt: str, _orientation: str) -> Optional[bytes]:
-        gemini_client = genai.Client(api_key=os.environ["GOOGLE_API_KEY"])
+        gemini_client = _get_gemini_client()
         image_config = types.GenerateImagesConfig(
             number_of_images=1,
             aspect_ratio="16:9" if _orientation == "landscape" else "9:16",
@@ -157,27 +365,333 @@ async def generate_image_with_gemini(prompt: str, orientation: str) -> Optional[
             prompt=_prompt,
             config=image_config,
         )
+        sdk_http_response = getattr(generated_image_container, "sdk_http_response", None)
+        limits.google_limiter.record_response(getattr(sdk_http_response, "headers", None))
         return generated_image_container.images[0].image_bytes
-    limits.ensure()
+    limits = get_limits()
     async with limits.google_sem:
         async with limits.google_limiter:
-            return await asyncio.to_thread(_generate_image_with_gemini, prompt, orientation)
+            return await run_provider_call(_generate_image_with_gemini, prompt, orientation)
 
 
 async def generate_image_with_openai(prompt: str, orientation: str) -> Optional[bytes]:
     def _generate_image_with_openai(_prompt: str, _orientation: str) -> Optional[bytes]:
-        openai_client = OpenAI(api_key=os.environ["OPENAI_API_KEY"])
-        generated_image = openai_client.images.generate(
+        openai_client = _get_openai_client()
+        raw_response = openai_client.images.with_raw_response.generate(
             prompt=_prompt,
             model="gpt-image-1.5",
             quality="high",
             size="1536x1024" if _orientation == "landscape" else "1024x1536"
         )
+        limits.openai_limiter.record_response(raw_response.headers)
+        generated_image = raw_response.parse()
         return base64.b64decode(generated_image.data[0].b64_json)
-    limits.ensure()
+    limits = get_limits()
     async with limits.openai_sem:
         async with limits.openai_limiter:
-            return await asyncio.to_thread(_generate_image_with_openai, prompt, orientation)
+            return await run_provider_call(_generate_image_with_openai, prompt, orientation)
+
+def serialize_payload(payload: dict, per_call_keys: tuple[str, ...] = ()) -> str:
+    """
+    Serializes an LLM payload to its canonical form: compact separators, non-ASCII characters kept as-is, keys sorted
+    except for `per_call_keys`, which come last in the given order. Every payload sent to a model or used as a cache key
+    goes through here, so equal payloads always render to byte-identical strings.
+    Parameters:
+        payload (dict): The payload to serialize.
+        per_call_keys (tuple[str, ...]): Keys to serialize after all the others (see build_messages).
+    Returns:
+        str: The serialized payload.
+    """
+    ordered_payload = {key: payload[key] for key in sorted(payload) if key not in per_call_keys}
+    ordered_payload.update((key, payload[key]) for key in per_call_keys if key in payload)
+    return json.dumps(ordered_payload, separators=(",", ":"), ensure_ascii=False)
+
+def build_messages(system_prompt: str, payload: dict | str, inline_system_prompt: bool = False,
+                   per_call_keys: tuple[str, ...] = ()) -> list[BaseMessage]:
+    """
+    Builds the message list for a structured LLM call. The system prompt is always sent first and byte-for-byte
+    unchanged, and the payload is serialized deterministically (sorted keys, no whitespace) with the fields that change
+    between related calls placed last, so consecutive calls share the longest possible prefix and hit the providers'
+    prompt caches.
+    Parameters:
+        system_prompt (str): The static system prompt for the task.
+        payload (dict | str): The dynamic input for this call. Raw text is sent as-is.
+        inline_system_prompt (bool): Send the prompt and payload as a single human message, for models that handle
+            system messages poorly (e.g. Gemini 3).
+        per_call_keys (tuple[str, ...]): Payload keys that differ between the calls of one pipeline step (e.g. the
+            current segment). They are serialized after the shared keys, in the given order.
+    Returns:
+        list[BaseMessage]: The messages to pass to the model.
+    """
+    serialized_payload = payload if isinstance(payload, str) else serialize_payload(payload, per_call_keys)
+    if inline_system_prompt:
+        return [HumanMessage(content=system_prompt + "\n\nThe payload is as follows:\n" + serialized_payload)]
+    return [SystemMessage(content=system_prompt), HumanMessage(content=serialized_payload)]
+
+
+# in-process cache of structured LLM replies keyed by (prompt name, normalized payload). Retries and batch runs resend
+# identical or near-identical goal/hook payloads, and a hit skips the whole multi-second round-trip
+LLM_RESPONSE_CACHE_MAX_SIZE = 4096
+# how long the later pipeline stages replay a reply for an exactly repeated payload. Long enough to absorb retries of a
+# run, short enough that a deliberate re-run still gets a fresh script
+REPLAY_TTL_SECONDS = 600
+# tones where a fresh, varied answer on every run is wanted
+UNCACHED_TONES = frozenset({"Dramatic"})
+_llm_response_cache: OrderedDict[tuple[str, str], tuple[Optional[float], BaseModel]] = OrderedDict()
+_llm_response_cache_lock = threading.Lock()
+# filler words dropped when matching near-duplicate free text. Negations are deliberately not in here
+_CACHE_KEY_STOPWORDS = frozenset({"a", "an", "the", "of", "for", "to", "in", "into", "on", "at", "by", "and", "or",
+                                  "with", "who", "that", "are", "is", "about", "looking", "interested"})
+_CACHE_KEY_WORD_RE = re.compile(r"[a-z0-9]+")
+
+def _normalize_cache_key_text(text: str) -> str:
+    """
+    Reduces free text to its content words, so near-duplicates such as "Health-conscious millennials" and "health
+    conscious millennials." map to the same cache entry. Word order and repeated words are kept: "cats better than
+    dogs" and "dogs better than cats" ask for different things.
+    Parameters:
+        text (str): The text to normalize.
+    Returns:
+        str: The normalized text.
+    """
+    words = [word for word in _CACHE_KEY_WORD_RE.findall(text.lower()) if word not in _CACHE_KEY_STOPWORDS]
+    return " ".join(words)
+
+def invoke_with_response_cache(structured_model: Runnable, prompt_name: str, payload: dict,
+                               make_messages: Callable[[], list[BaseMessage]],
+                               ttl_seconds: Optional[float] = None) -> BaseModel:
+    """
+    Invokes a structured-output model, returning the cached reply when the same prompt was already answered in this
+    process for the same payload. The lookup happens before `make_messages` is called, so a hit skips assembling the
+    prompt as well as the round-trip. The cache is a bounded LRU.
+    Without `ttl_seconds` (goal and hook), entries never expire, payloads match up to casing, punctuation and filler
+    words, and tones in UNCACHED_TONES bypass the cache. With it, the payload must match exactly and the
+    entry is only replayed for that many seconds, which makes retries of a run idempotent.
+    Parameters:
+        structured_model (Runnable): The model returned by `with_structured_output`.
+        prompt_name (str): The PROMPTS key of the system prompt the messages are built from.
+        payload (dict): The payload the messages are built from; with `prompt_name` it forms the cache key.
+        make_messages (Callable[[], list[BaseMessage]]): Builds the messages to send on a cache miss.
+        ttl_seconds (Optional[float]): How long the reply may be replayed, or None to keep it until evicted.
+    Returns:
+        BaseModel: The structured reply.
+    """
+    if ttl_seconds is None and payload.get("tone") in UNCACHED_TONES:
+        return structured_model.invoke(make_messages())
+
+    if ttl_seconds is None:
+        # every field takes part in the key, so tone, platform and purpose still partition the cache exactly
+        payload = {key: _normalize_cache_key_text(value) if isinstance(value, str) else value
+                   for key, value in payload.items()}
+    cache_key = (prompt_name, serialize_payload(payload))
+    with _llm_response_cache_lock:
+        if cache_key in _llm_response_cache:
+            expires_at, response = _llm_response_cache[cache_key]
+            if expires_at is None or expires_at > time.monotonic():
+                _llm_response_cache.move_to_end(cache_key)
+                return response
+            del _llm_response_cache[cache_key]
+
+    response = structured_model.invoke(make_messages())
+    expires_at = None if ttl_seconds is None else time.monotonic() + ttl_seconds
+    with _llm_response_cache_lock:
+        _llm_response_cache[cache_key] = (expires_at, response)
+        if len(_llm_response_cache) > LLM_RESPONSE_CACHE_MAX_SIZE:
+            _llm_response_cache.popitem(last=False)
+    return response
+
+
+# deterministic script segmentation. The raw script is cut at sentence (and paragraph) boundaries, then each cut is
+# carried over to the enhanced script by aligning the words of both tracks, so no LLM call is needed for the common case
+SEGMENT_MIN_WORDS = 12
+SEGMENT_MAX_WORDS = 35
+# below this word-level similarity the enhancer rewrote too much to align the tracks reliably
+SEGMENT_ALIGNMENT_MIN_RATIO = 0.6
+_TAG_RE = re.compile(r"\[[^\[\]\n]*\]")
+_WORD_RE = re.compile(r"[\w'’]+")
+_SENTENCE_END_RE = re.compile(r"[.!?…]+[\"'”’)]*(?=\s|$)")
+_CLAUSE_END_RE = re.compile(r"[;:,]+(?=\s)|[—–]+")
+_PARAGRAPH_BREAK_RE = re.compile(r"\n\s*\n")
+_TRAILING_PUNCTUATION_RE = re.compile(r"[^\s\[]*")
+_ABBREVIATIONS = frozenset({"mr", "mrs", "ms", "dr", "prof", "sr", "jr", "st", "vs", "etc", "inc", "ltd", "co", "no",
+                            "approx", "dept", "est", "fig", "vol"})
+
+def _is_abbreviation(text: str, end: int) -> bool:
+    token = text[:end].split()[-1].lower().strip("\"'“‘(").rstrip(".")
+    # "e.g.", "U.S.", "p.m." and single initials all end in a period that doesn't close the sentence
+    return token in _ABBREVIATIONS or "." in token or (len(token) == 1 and token.isalpha())
+
+def _split_by_word_count(text: str, start: int, end: int) -> list[tuple[int, int]]:
+    # near-equal runs of at most SEGMENT_MAX_WORDS words, for text with no punctuation left to cut at
+    word_starts = [match.start() for match in _WORD_RE.finditer(text, start, end)]
+    piece_count = -(-len(word_starts) // SEGMENT_MAX_WORDS)
+    piece_words = -(-len(word_starts) // piece_count)
+    cuts = [start, *word_starts[piece_words::piece_words], end]
+    return list(zip(cuts, cuts[1:]))
+
+def _split_long_sentence(text: str, start: int, end: int) -> list[tuple[int, int]]:
+    # clauses are packed greedily up to SEGMENT_MAX_WORDS; a piece that's still too long is split by word count
+    pieces, piece_start, last_cut = [], start, None
+    for match in _CLAUSE_END_RE.finditer(text, start, end):
+        if match.end() >= end:
+            break
+        if (last_cut is not None and last_cut > piece_start
+                and len(_WORD_RE.findall(text, piece_start, match.end())) > SEGMENT_MAX_WORDS):
+            pieces.append((piece_start, last_cut))
+            piece_start = last_cut
+        last_cut = match.end()
+    if (last_cut is not None and last_cut > piece_start
+            and len(_WORD_RE.findall(text, piece_start, end)) > SEGMENT_MAX_WORDS):
+        pieces.append((piece_start, last_cut))
+        piece_start = last_cut
+    pieces.append((piece_start, end))
+    return [piece for piece_start, piece_end in pieces
+            for piece in (_split_by_word_count(text, piece_start, piece_end)
+                          if len(_WORD_RE.findall(text, piece_start, piece_end)) > SEGMENT_MAX_WORDS
+                          else [(piece_start, piece_end)])]
+
+def _split_into_sentences(script: str) -> list[tuple[int, int, bool]]:
+    sentence_ends = {match.end(): False for match in _SENTENCE_END_RE.finditer(script)
+                     if script[match.end() - 1] != "." or not _is_abbreviation(script, match.end())}
+    sentence_ends.update({match.start(): True for match in _PARAGRAPH_BREAK_RE.finditer(script)})
+    sentences, start = [], 0
+    for end in sorted(sentence_ends) + [len(script)]:
+        if script[start:end].strip():
+            ends_paragraph = sentence_ends.get(end, True)
+            # a sentence longer than a whole segment is split at its clauses, so it can't become one oversized segment
+            if len(_WORD_RE.findall(script, start, end)) > SEGMENT_MAX_WORDS:
+                pieces = _split_long_sentence(script, start, end)
+                sentences.extend((piece_start, piece_end, False) for piece_start, piece_end in pieces[:-1])
+                sentences.append((*pieces[-1], ends_paragraph))
+            else:
+                sentences.append((start, end, ends_paragraph))
+            start = end
+    return sentences
+
+def segment_script_deterministically(script: str, enhanced_script: str) -> Optional[list[dict[str, str]]]:
+    """
+    Splits a script and its audio enhanced version into aligned segments without calling an LLM. Sentences of the raw
+    script (split at clauses, or by word count, when a sentence alone is too long) are grouped into segments of roughly
+    SEGMENT_MIN_WORDS to SEGMENT_MAX_WORDS words, never across a paragraph break, and each cut is placed in the
+    enhanced script at the matching sentence end, so audio tags stay at the start of the segment they affect.
+    Parameters:
+        script (str): The raw script.
+        enhanced_script (str): The enhanced version of the script, containing audio tags such as [pause].
+    Returns:
+        Optional[list[dict[str, str]]]: The `script_segment`/`enhanced_script_segment` pairs, or None when the two
+            tracks differ too much to be aligned, in which case the caller should fall back to the LLM segmenter.
+    """
+    raw_word_spans = [match.span() for match in _WORD_RE.finditer(script)]
+    # blank the tags out (keeping offsets) so they are neither aligned as words nor mistaken for sentence ends
+    masked_enhanced_script = _TAG_RE.sub(lambda match: " " * len(match.group()), enhanced_script)
+    enhanced_word_spans = [match.span() for match in _WORD_RE.finditer(masked_enhanced_script)]
+    if not raw_word_spans or not enhanced_word_spans:
+        return None
+
+    # group sentences into segments and record each segment's raw character span
+    raw_segment_spans: list[tuple[int, int]] = []
+    segment_start = segment_words = 0
+    for sentence_start, sentence_end, ends_paragraph in _split_into_sentences(script):
+        sentence_words = len(_WORD_RE.findall(script, sentence_start, sentence_end))
+        if segment_words >= SEGMENT_MIN_WORDS or (segment_words and segment_words + sentence_words > SEGMENT_MAX_WORDS):
+            raw_segment_spans.append((segment_start, sentence_start))
+            segment_start, segment_words = sentence_start, 0
+        segment_words += sentence_words
+        if ends_paragraph:
+            raw_segment_spans.append((segment_start, sentence_end))
+            segment_start, segment_words = sentence_end, 0
+    if segment_words:
+        raw_segment_spans.append((segment_start, len(script)))
+
+    raw_words = [script[start:end].lower() for start, end in raw_word_spans]
+    enhanced_words = [enhanced_script[start:end].lower() for start, end in enhanced_word_spans]
+    matcher = difflib.SequenceMatcher(None, raw_words, enhanced_words, autojunk=False)
+    if matcher.ratio() < SEGMENT_ALIGNMENT_MIN_RATIO:
+        return None
+    raw_to_enhanced_word: dict[int, int] = {}
+    for raw_index, enhanced_index, size in matcher.get_matching_blocks():
+        raw_to_enhanced_word.update((raw_index + offset, enhanced_index + offset) for offset in range(size))
+
+    # move each raw cut onto the enhanced script: between the last aligned word before the cut and the first aligned
+    # word after it, cut at the first sentence end, or right after the last aligned word if there is none
+    enhanced_cuts = [0]
+    raw_word_starts = [start for start, _ in raw_word_spans]
+    for _, raw_cut in raw_segment_spans[:-1]:
+        first_word_after_cut = next(i for i, start in enumerate(raw_word_starts) if start >= raw_cut)
+        left = max((raw_to_enhanced_word[i] for i in range(first_word_after_cut) if i in raw_to_enhanced_word),
+                   default=None)
+        right = min((raw_to_enhanced_word[i] for i in range(first_word_after_cut, len(raw_words))
+                     if i in raw_to_enhanced_word), default=None)
+        gap_start = enhanced_word_spans[left][1] if left is not None else 0
+        gap_end = enhanced_word_spans[right][0] if right is not None else len(enhanced_script)
+        sentence_end = _SENTENCE_END_RE.search(masked_enhanced_script, gap_start, gap_end)
+        if sentence_end:
+            enhanced_cut = sentence_end.end()
+        else:
+            enhanced_cut = gap_start + len(_TRAILING_PUNCTUATION_RE.match(enhanced_script, gap_start, gap_end).group())
+        if enhanced_cut <= enhanced_cuts[-1]:
+            return None
+        enhanced_cuts.append(enhanced_cut)
+    enhanced_cuts.append(len(enhanced_script))
+
+    script_list = []
+    for (raw_start, raw_end), enhanced_start, enhanced_end in zip(raw_segment_spans, enhanced_cuts, enhanced_cuts[1:]):
+        script_segment = " ".join(script[raw_start:raw_end].split())
+        enhanced_script_segment = " ".join(enhanced_script[enhanced_start:enhanced_end].split())
+        if not enhanced_script_segment:
+            return None
+        script_list.append({"script_segment": script_segment, "enhanced_script_segment": enhanced_script_segment})
+    return script_list
+
+
+# heuristics for the audio enhancer. Most scripts read naturally as written and the enhancer prompt itself prefers zero
+# or few tags, so only paragraphs showing one of these cues are sent to the LLM; the rest are kept verbatim
+ENHANCEMENT_LONG_CLAUSE_WORDS = 30
+_EMPHATIC_SENTENCE_END_RE = re.compile(r"[!?]+")
+_IMPERATIVE_OPENING_RE = re.compile(
+    r"(?:^|[.!?…]\s+)(?:stop|wait|listen|look|imagine|picture this|here'?s|here is|guess what)\b", re.IGNORECASE)
+_DIALOGUE_RE = re.compile(r"\"[^\"\n]+\"|“[^”\n]+”|^\s*[A-Z][\w ]{0,30}:\s", re.MULTILINE)
+_CLAUSE_SPLIT_RE = re.compile(r"[.!?…,;:—–()\n]")
+
+def paragraph_needs_audio_enhancement(paragraph: str) -> bool:
+    """
+    Decides whether a script paragraph has delivery cues worth tagging for audio generation: a cluster of exclamations
+    or questions, an imperative or "here's" opening, dialogue, or a clause too long to read without a breath.
+    Parameters:
+        paragraph (str): A paragraph of the raw script.
+    Returns:
+        bool: Whether the paragraph should be sent to the enhancer LLM.
+    """
+    return (len(_EMPHATIC_SENTENCE_END_RE.findall(paragraph)) >= 2
+            or _IMPERATIVE_OPENING_RE.search(paragraph) is not None
+            or _DIALOGUE_RE.search(paragraph) is not None
+            or any(len(clause.split()) > ENHANCEMENT_LONG_CLAUSE_WORDS for clause in _CLAUSE_SPLIT_RE.split(paragraph)))
+
+def enhance_script_selectively(structured_model: Runnable, script: str, inline_system_prompt: bool = False) -> str:
+    """
+    Enhances a script for audio generation, sending only the paragraphs flagged by `paragraph_needs_audio_enhancement`
+    to the enhancer (one batched call per flagged paragraph) and splicing the results back between the untouched ones.
+    A script with no flagged paragraph is returned unchanged without any LLM call.
+    Parameters:
+        structured_model (Runnable): The enhancer model, structured to `{"enhanced_script": str}`.
+        script (str): The raw script.
+        inline_system_prompt (bool): Passed through to build_messages.
+    Returns:
+        str: The enhanced script.
+    """
+    paragraphs = _PARAGRAPH_BREAK_RE.split(script)
+    flagged_indices = [index for index, paragraph in enumerate(paragraphs) if paragraph_needs_audio_enhancement(paragraph)]
+    if not flagged_indices:
+        return script
+
+    enhanced_containers = structured_model.batch([
+        build_messages(PROMPTS["script_enhancer"], {"script": paragraphs[index].strip()}, inline_system_prompt)
+        for index in flagged_indices
+    ])
+    for index, enhanced_container in zip(flagged_indices, enhanced_containers):
+        paragraphs[index] = enhanced_container.enhanced_script
+    return "\n\n".join(paragraph.strip() for paragraph in paragraphs)
+
 
 def get_video_duration(video_path: str) -> float:
     """Get duration of video file in seconds."""
@@ -190,6 +704,61 @@ def get_video_duration(video_path: str) -> float:
         return 0.0
 
 
+# content-addressed cache of generated images, keyed by provider, orientation and prompt. Re-running a pipeline (or a
+# retry after a later step failed) only pays for images whose prompts actually changed. The images are bounded to
+# IMAGE_CACHE_MAX_BYTES: after each generate_image call the least recently used ones are deleted until the cache fits.
+# Deleting the directory by hand is always safe; it only costs regenerations
+IMAGE_CACHE_DIR = Path(os.environ.get("MOCEAN_CACHE_DIR", Path(tempfile.gettempdir()) / "mocean_img_cache"))
+IMAGE_CACHE_MAX_BYTES = int(os.environ.get("MOCEAN_IMAGE_CACHE_MAX_MB", "2048")) * 1024 * 1024
+
+def _image_cache_path(image_model_provider: str, orientation: str, prompt: str) -> Path:
+    cache_key = hashlib.sha256(f"{image_model_provider}|{orientation}|{prompt}".encode("utf-8")).hexdigest()
+    return IMAGE_CACHE_DIR / cache_key
+
+def _store_in_image_cache(cache_path: Path, image: bytes | Path) -> None:
+    # written under a temporary name and renamed, so a concurrent reader never sees a partial image. Providers that
+    # stream to disk pass the written file instead of bytes, and it's copied in
+    IMAGE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    temporary_path = cache_path.with_suffix(f".{uuid.uuid4().hex}.tmp")
+    if isinstance(image, Path):
+        shutil.copyfile(image, temporary_path)
+    else:
+        temporary_path.write_bytes(image)
+    temporary_path.replace(cache_path)
+
+def _copy_from_image_cache(cache_path: Path, image_path: Path) -> bool:
+    """
+    Copies a cached image to the output path, marking it as recently used. A copy rather than a hard link, since the
+    pipelines overwrite output images in place and that would rewrite the cache entry too.
+    Parameters:
+        cache_path (Path): The cache entry.
+        image_path (Path): Where the image is needed.
+    Returns:
+        bool: False if the entry doesn't exist (or was evicted since it was looked up).
+    """
+    try:
+        shutil.copyfile(cache_path, image_path)
+        os.utime(cache_path)
+    except FileNotFoundError:
+        return False
+    return True
+
+def _prune_image_cache() -> None:
+    """Deletes the least recently used cached images until the cache is within IMAGE_CACHE_MAX_BYTES."""
+    try:
+        with os.scandir(IMAGE_CACHE_DIR) as entries:
+            cached_images = [(entry.stat().st_mtime, entry.stat().st_size, entry.path)
+                             for entry in entries if entry.is_file() and not entry.name.endswith(".tmp")]
+    except FileNotFoundError:
+        return
+    total_bytes = sum(size for _, size, _ in cached_images)
+    for _, size, path in sorted(cached_images):
+        if total_bytes <= IMAGE_CACHE_MAX_BYTES:
+            break
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(path)
+        total_bytes -= size
+
 async def generate_image(image_descriptions: str | list[str], image_paths: Path | list[Path], image_model_provider: str, orientation: str):
     if isinstance(image_descriptions, str):
         image_descriptions = [image_descriptions]
@@ -201,27 +770,38 @@ async def generate_image(image_descriptions: str | list[str], image_paths: Path
 
     print("generate_image ran...")
 
-    tasks: list[tuple[int, asyncio.Task[Optional[bytes]]]] = []
+    # each task writes its own image (and cache entry) in a worker thread as soon as it's generated, so the disk writes
+    # overlap the generations still in flight instead of running one after another on the loop once all are done
+    async def _generate_and_write(index: int, image_description: str) -> None:
+        cache_path = _image_cache_path(image_model_provider, orientation, image_description)
+        # the cache copy runs in a worker thread too, so hits don't block the loop before the generations start
+        if await asyncio.to_thread(_copy_from_image_cache, cache_path, image_paths[index]):
+            return
+
+        match image_model_provider:
+            case "google":
+                image_generation_result = await generate_image_with_gemini(prompt=image_description, orientation=orientation)
+
+            case "openai":
+                image_generation_result = await generate_image_with_openai(prompt=image_description, orientation=orientation)
+
+            case "flux":
+                # flux streams straight into the output file, so there are no bytes to write here
+                if not await generate_image_with_flux(prompt=image_description, orientation=orientation,
+                                                      image_path=image_paths[index]):
+                    raise RuntimeError(f"Image generation failed. Image model {image_model_provider}.")
+                await asyncio.to_thread(_store_in_image_cache, cache_path, image_paths[index])
+                return
+
+        if not image_generation_result: # generation failed, we need retry logic later
+            raise RuntimeError(f"Image generation failed. Image model {image_model_provider}.")
+        await asyncio.to_thread(image_paths[index].write_bytes, image_generation_result)
+        await asyncio.to_thread(_store_in_image_cache, cache_path, image_generation_result)
+
     async with asyncio.TaskGroup() as tg:
         for index, image_description in enumerate(image_descriptions):
-            match image_model_provider:
-                case "google":
-                    image_generation_task = tg.create_task(generate_image_with_gemini(prompt=image_description, orientation=orientation))
-
-                case "openai":
-                    image_generation_task = tg.create_task(generate_image_with_openai(prompt=image_description, orientation=orientation))
-
-                case "flux":
-                    image_generation_task = tg.create_task(generate_image_with_flux(prompt=image_description, orientation=orientation))
-
-            tasks.append((index, image_generation_task))
-    for index, image_generation_task in tasks:
-        image_generation_result = image_generation_task.result()
-        if image_generation_result:
-            with open(image_paths[index], "wb") as image_file:
-                image_file.write(image_generation_result)
-        else: # generation failed, we need retry logic later
-            raise RuntimeError(f"Image generation failed. Image model {image_model_provider}.")
+            tg.create_task(_generate_and_write(index, image_description))
+    await asyncio.to_thread(_prune_image_cache)
 
 #
 # def generate_image(image_descriptions: str | list[str], image_paths: Path | list[Path], image_model_provider: str,
@@ -404,6 +984,91 @@ async def generate_image(image_descriptions: str | list[str], image_paths: Path
 # from pathlib import Path
 #
 #
+# H.264 encoder settings for rendered clips, in order of preference. Hardware encoders are 5-20x faster than libx264's
+# "slow" preset; their options target a similar quality/size. MOCEAN_VIDEO_ENCODER forces one by name
+VIDEO_ENCODER_OPTIONS: dict[str, dict[str, str | int]] = {
+    "h264_nvenc": {"vcodec": "h264_nvenc", "preset": "p5", "rc": "vbr", "cq": 23, "b:v": "6M", "pix_fmt": "yuv420p"},
+    "h264_videotoolbox": {"vcodec": "h264_videotoolbox", "b:v": "6M", "pix_fmt": "yuv420p"},
+    "h264_qsv": {"vcodec": "h264_qsv", "preset": "slow", "global_quality": 23, "pix_fmt": "nv12"},
+    "libx264": {"vcodec": "libx264", "preset": "slow", "pix_fmt": "yuv420p"},  # reduced 150 to 11mb, no brainer
+}
+
+@functools.cache
+def get_video_encoder_options() -> dict[str, str | int]:
+    """
+    Picks the fastest H.264 encoder that works on this host, probing once per process. Builds often list hardware
+    encoders without a matching GPU, so each candidate is tried on a tiny test clip instead of trusting
+    `ffmpeg -encoders`; libx264 is the fallback.
+    Returns:
+        dict[str, str | int]: Output options for `ffmpeg.output`.
+    """
+    forced_encoder = os.environ.get("MOCEAN_VIDEO_ENCODER")
+    if forced_encoder in VIDEO_ENCODER_OPTIONS:
+        return VIDEO_ENCODER_OPTIONS[forced_encoder]
+    for encoder_name, encoder_options in VIDEO_ENCODER_OPTIONS.items():
+        if encoder_name == "libx264":
+            break
+        try:
+            (
+                ffmpeg.input("color=black:s=256x256:d=0.1", f="lavfi")
+                .output("-", f="null", **encoder_options)
+                .run(quiet=True)
+            )
+            return encoder_options
+        except (ffmpeg.Error, OSError):
+            continue
+    return VIDEO_ENCODER_OPTIONS["libx264"]
+
+# zoompan formulas per motion pattern. Placeholders are filled per clip in animate_with_motion_effect: tf = total frames
+# of the clip, ps/zs/rs/kb = pan/zoom/rock/ken burns speed, fps = output frame rate
+MOTION_STYLE_TEMPLATES = {
+    "pan_right": {
+        "z": "1.1",
+        "x": "(iw - iw/zoom) * {ps} * (on / {tf})",
+        "y": "ih/2 - (ih/zoom/2)",
+    },
+    "pan_left": {
+        "z": "1.1",
+        "x": "(iw - iw/zoom) * {ps} * (1 - on / {tf})",
+        "y": "ih/2 - (ih/zoom/2)",
+    },
+    "pan_down": {
+        "z": "1.1",
+        "x": "iw/2 - (iw/zoom/2)",
+        "y": "(ih - ih/zoom) * {ps} * (on / {tf})",
+    },
+    "pan_up": {
+        "z": "1.1",
+        "x": "iw/2 - (iw/zoom/2)",
+        "y": "(ih - ih/zoom) * {ps} * (1 - on / {tf})",
+    },
+    "zoom_in": {
+        "z": "min(1 + on/{tf} * {zs}, 1 + {zs})",
+        "x": "iw/2 - (iw/zoom/2)",
+        "y": "ih/2 - (ih/zoom/2)",
+    },
+    "zoom_out": {
+        "z": "max(1 + {zs} - on/{tf} * {zs}, 1)",
+        "x": "iw/2 - (iw/zoom/2)",
+        "y": "ih/2 - (ih/zoom/2)",
+    },
+    "rock_horizontal": {
+        "z": "1.05",
+        "x": "iw/2-(iw/zoom/2) + sin(on*PI/{fps}*0.5) * {rs}",
+        "y": "ih/2-(ih/zoom/2)",
+    },
+    "rock_vertical": {
+        "z": "1.05",
+        "x": "iw/2-(iw/zoom/2)",
+        "y": "ih/2-(ih/zoom/2) + sin(on*PI/{fps}*0.5) * {rs}",
+    },
+    "ken_burns": {
+        "z": "1 + on/{tf} * {zs}",
+        "x": "iw/2-(iw/zoom/2) + on*({kb} / {fps})",
+        "y": "ih/2-(ih/zoom/2) + on*({kb} / {fps})",
+    },
+}
+
 def animate_with_motion_effect(
         image_paths: Path | list[Path],
         video_path: Path,
@@ -434,66 +1099,23 @@ def animate_with_motion_effect(
 
     try:
         sub_clips = []
+        last_index = len(image_paths) - 1
         for index, image_path in enumerate(image_paths):
             # 1. Determine exact duration and frame count for THIS clip
-            duration = ideal_image_duration if image_path != image_paths[-1] else last_image_duration
+            # compared by position, not path, so a repeated image can't take the last clip's duration early
+            duration = ideal_image_duration if index != last_index else last_image_duration
             total_frames = int(duration * fps)
 
             # 2. Select the motion pattern
             current_pattern = motion_pattern[pattern_index % pattern_length]
 
-            # 3. Define the formulas dynamically using the CALCULATED total_frames
+            # 3. Fill in the formulas for this clip's pattern using the CALCULATED total_frames
             # We inject the integer 'total_frames' directly into the string so FFmpeg sees numbers, not variables.
-            styles = {
-                "pan_right": {
-                    "z": "1.1",
-                    "x": f"(iw - iw/zoom) * {pan_speed} * (on / {total_frames})",
-                    "y": "ih/2 - (ih/zoom/2)",
-                },
-                "pan_left": {
-                    "z": "1.1",
-                    "x": f"(iw - iw/zoom) * {pan_speed} * (1 - on / {total_frames})",
-                    "y": "ih/2 - (ih/zoom/2)",
-                },
-                "pan_down": {
-                    "z": "1.1",
-                    "x": "iw/2 - (iw/zoom/2)",
-                    "y": f"(ih - ih/zoom) * {pan_speed} * (on / {total_frames})",
-                },
-                "pan_up": {
-                    "z": "1.1",
-                    "x": "iw/2 - (iw/zoom/2)",
-                    "y": f"(ih - ih/zoom) * {pan_speed} * (1 - on / {total_frames})",
-                },
-                "zoom_in": {
-                    "z": f"min(1 + on/{total_frames} * {zoom_speed}, 1 + {zoom_speed})",
-                    "x": "iw/2 - (iw/zoom/2)",
-                    "y": "ih/2 - (ih/zoom/2)",
-                },
-                "zoom_out": {
-                    "z": f"max(1 + {zoom_speed} - on/{total_frames} * {zoom_speed}, 1)",
-                    "x": "iw/2 - (iw/zoom/2)",
-                    "y": "ih/2 - (ih/zoom/2)",
-                },
-                "rock_horizontal": {
-                    "z": "1.05",
-                    "x": f"iw/2-(iw/zoom/2) + sin(on*PI/{fps}*0.5) * {rock_speed}",
-                    "y": "ih/2-(ih/zoom/2)",
-                },
-                "rock_vertical": {
-                    "z": "1.05",
-                    "x": "iw/2-(iw/zoom/2)",
-                    "y": f"ih/2-(ih/zoom/2) + sin(on*PI/{fps}*0.5) * {rock_speed}",
-                },
-                "ken_burns": {
-                    "z": f"1 + on/{total_frames} * {zoom_speed}",
-                    "x": f"iw/2-(iw/zoom/2) + on*({kenburns_speed} / {fps})",
-                    "y": f"ih/2-(ih/zoom/2) + on*({kenburns_speed} / {fps})",
-                },
+            style = {
+                axis: template.format(tf=total_frames, ps=pan_speed, zs=zoom_speed, rs=rock_speed, kb=kenburns_speed, fps=fps)
+                for axis, template in MOTION_STYLE_TEMPLATES[current_pattern].items()
             }
 
-            style = styles[current_pattern]
-
             # 4. Create the input stream
             # loop=1 turns the image into a video stream (prevents jitter)
             # t=duration sets the length
@@ -504,12 +1126,14 @@ def animate_with_motion_effect(
             #     new_clip = new_clip.filter('scale', w=-2, h=3000)
             # else:
             #     new_clip = new_clip.filter('scale', w=3000, h=-2)
+            # zoompan positions its crop on whole input pixels, so the overscale is what keeps slow motion from stepping.
+            # bilinear is enough here: zoompan's own downsample to output_size discards the detail lanczos would add
             if orientation == "portrait":
                 # 2x overscale of 1080x1920
-                new_clip = new_clip.filter("scale", 2160, 3840, flags="lanczos")
+                new_clip = new_clip.filter("scale", 2160, 3840, flags="bilinear")
             else:
                 # 2x overscale of 1920x1080
-                new_clip = new_clip.filter("scale", 3840, 2160, flags="lanczos")
+                new_clip = new_clip.filter("scale", 3840, 2160, flags="bilinear")
 
             # 6. Apply Zoompan
             # d=1 is CRITICAL. It means "produce 1 output frame for 1 input frame".
@@ -526,7 +1150,9 @@ def animate_with_motion_effect(
 
             # 7. Force correct pixel aspect ratio
             new_clip = new_clip.filter("setsar", "1")
-            new_clip = new_clip.filter('tmix', frames=3) # wasn't here, makes videos much smoother
+            # wasn't here, makes videos much smoother. Two frames already hide the one-pixel steps; a third only adds blur
+            # and another full-resolution frame to blend per output frame
+            new_clip = new_clip.filter('tmix', frames=2)
 
             pattern_index += 1
             sub_clips.append(new_clip)
@@ -537,10 +1163,8 @@ def animate_with_motion_effect(
         outfile = ffmpeg.output(
             animated_video_stream,
             str(video_path),
-            vcodec="libx264",
-            pix_fmt="yuv420p",
             r=fps,
-            preset="slow" # reduced 150 to 11mb, no brainer
+            **get_video_encoder_options(),
         )
         outfile.run(overwrite_output=True)
 
@@ -553,13 +1177,31 @@ def animate_with_motion_effect(
         error_message = e.stderr.decode() if e.stderr else str(e)
         raise RuntimeError(f"FFmpeg error while animating: {error_message}")
 
+# extracted topic lists, stored next to the image cache as JSON files keyed by the hash of the prompt and the text, so
+# re-submitting the same text (or re-running the page) skips the LLM call and a prompt edit invalidates old entries
+TOPICS_CACHE_DIR = IMAGE_CACHE_DIR / "topics"
+
+def _topics_cache_path(text: str) -> Path:
+    cache_key = hashlib.sha256(f"{PROMPTS['topics_extractor']}\0{text}".encode("utf-8")).hexdigest()
+    return TOPICS_CACHE_DIR / f"{cache_key}.json"
+
+def _store_topics_in_cache(cache_path: Path, topics: list[str]) -> None:
+    TOPICS_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    temporary_path = cache_path.with_suffix(f".{uuid.uuid4().hex}.tmp")
+    temporary_path.write_text(json.dumps(topics, ensure_ascii=False), encoding="utf-8")
+    temporary_path.replace(cache_path)
+
 def extract_topics_form_text(text: str) -> list[str]:
-    ai_model_for_topics_container = ai_model.with_structured_output(TopicsContainer)
-    ai_message = AIMessage(content=topics_extractor_system_prompt)
-    human_message = HumanMessage(content=text)
-    messages = [ai_message, human_message]
+    cache_path = _topics_cache_path(text)
+    if cache_path.exists():
+        return json.loads(cache_path.read_text(encoding="utf-8"))
+
+    ai_model_for_topics_container = ai_model.with_structured_output(TopicsContainer, method=STRUCTURED_OUTPUT_METHOD)
+    messages = build_messages(PROMPTS["topics_extractor"], text)
     topics_container:BaseModel = ai_model_for_topics_container.invoke(messages)
     topics: list[str] = topics_container.topics
+
+    _store_topics_in_cache(cache_path, topics)
     return topics
 
 
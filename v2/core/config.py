@@ -8,6 +8,7 @@ limits, this is the file to edit.
 
 Organization:
   - Paths:          Where output files (audio, images, video) are saved
+  - Settings:       API keys read once from the environment
   - Video settings: FPS, resolution, overscale ratios for zoompan
   - Rate limiting:  Per-provider request throttling for image APIs
   - Enums/types:    Literal types for model providers, orientations, etc.
@@ -19,15 +20,14 @@ Organization:
 """
 
 import os
+from dataclasses import dataclass
 from enum import Enum
-from typing import Literal
+from types import MappingProxyType
+from typing import Literal, Mapping, Optional, get_args
 from pathlib import Path
 
 from dotenv import load_dotenv
 
-# Load .env from the project root (one level above v2/)
-load_dotenv()
-
 # ---------------------------------------------------------------------------
 # Paths — all output goes under v2/output/ with subdirectories per media type
 # ---------------------------------------------------------------------------
@@ -39,10 +39,97 @@ VIDEO_DIR = OUTPUT_DIR / "videos"                          # .mp4 per-segment cl
 FINAL_VIDEO_DIR = OUTPUT_DIR / "final_videos"              # .mp4 assembled finals
 SECTION_VIDEO_DIR = OUTPUT_DIR / "section_videos"          # .mp4 long-form sections
 DB_PATH = BASE_DIR / "database.db"                         # SQLite database
+LLM_CACHE_DIR = OUTPUT_DIR / "llm_cache"                   # .json cached LLM responses
+
+_OUTPUT_SUBDIRS = (AUDIO_DIR, IMAGE_DIR, VIDEO_DIR, FINAL_VIDEO_DIR, SECTION_VIDEO_DIR)
+
+# ---------------------------------------------------------------------------
+# Runtime setup — .env loading and output directories
+#
+# Deferred to this function instead of running on import, so modules that
+# only need a constant from here don't parse .env or hit the filesystem.
+# init_db() calls it, and every page calls init_db() before doing any work.
+# ---------------------------------------------------------------------------
+_runtime_ready = False
+
+
+def _ensure_output_dirs() -> None:
+    # one listing of OUTPUT_DIR instead of a mkdir per subdirectory; after
+    # the first run every subdirectory exists and nothing else is created
+    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+    with os.scandir(OUTPUT_DIR) as entries:
+        existing = {entry.name for entry in entries if entry.is_dir()}
+    for d in _OUTPUT_SUBDIRS:
+        if d.name not in existing:
+            d.mkdir(exist_ok=True)
+
+
+def ensure_runtime_ready() -> None:
+    """Load .env and create the output directories. Safe to call repeatedly."""
+    global _runtime_ready
+    if _runtime_ready:
+        return
+    # Load .env from the project root (one level above v2/)
+    load_dotenv()
+    # Create directories up front so we never get FileNotFoundError
+    _ensure_output_dirs()
+    refresh_settings()
+    _runtime_ready = True
+
+
+# ---------------------------------------------------------------------------
+# Settings — API keys, read from the environment once instead of by every
+# service call. Services use get_settings() rather than importing the
+# instance, so they see the rebuilt one after .env is loaded.
+#
+# To add a new key:
+#   1. Add a field here
+#   2. Read it in Settings.from_env()
+#
+# llm_concurrency (MOCEAN_LLM_CONCURRENCY) caps the LLM requests in flight at
+# once across the whole process. Chapter editing and per-segment image
+# descriptions fan out one call per item; the cap keeps a long ebook from
+# bursting past the provider's rate limit.
+# ---------------------------------------------------------------------------
+@dataclass(frozen=True, slots=True)
+class Settings:
+    google_api_key: Optional[str]
+    openai_api_key: Optional[str]
+    bfl_api_key: Optional[str]
+    eleven_labs_api_key: Optional[str]
+    tavily_api_key: Optional[str]
+    runway_api_key: Optional[str]
+    luma_api_key: Optional[str]
+    kling_api_key: Optional[str]
+    llm_concurrency: int
+
+    @classmethod
+    def from_env(cls) -> "Settings":
+        return cls(
+            google_api_key=os.environ.get("GOOGLE_API_KEY"),
+            openai_api_key=os.environ.get("OPENAI_API_KEY"),
+            bfl_api_key=os.environ.get("BFL_API_KEY"),
+            eleven_labs_api_key=os.environ.get("ELEVEN_LABS_API_KEY"),
+            tavily_api_key=os.environ.get("TAVILY_API_KEY"),
+            runway_api_key=os.environ.get("RUNWAY_API_KEY"),
+            luma_api_key=os.environ.get("LUMA_API_KEY"),
+            kling_api_key=os.environ.get("KLING_API_KEY"),
+            llm_concurrency=int(os.environ.get("MOCEAN_LLM_CONCURRENCY", "6")),
+        )
+
 
-# Create directories on import so we never get FileNotFoundError
-for d in (AUDIO_DIR, IMAGE_DIR, VIDEO_DIR, FINAL_VIDEO_DIR, SECTION_VIDEO_DIR):
-    d.mkdir(parents=True, exist_ok=True)
+_settings = Settings.from_env()
+
+
+def get_settings() -> Settings:
+    return _settings
+
+
+def refresh_settings() -> Settings:
+    """Re-read the environment, e.g. after load_dotenv() or a key change."""
+    global _settings
+    _settings = Settings.from_env()
+    return _settings
 
 # ---------------------------------------------------------------------------
 # Video encoding settings
@@ -69,17 +156,24 @@ OPENAI_SEMAPHORE = 8                    # Max concurrent OpenAI image requests
 FLUX_SEMAPHORE = 5                      # Max concurrent Flux requests
 
 # ---------------------------------------------------------------------------
-# Type aliases used by Pydantic models and function signatures
+# Type aliases used by Pydantic models and function signatures. The matching
+# UI option tuples below are derived from these with get_args(), so a form
+# can only offer values the models accept.
 # ---------------------------------------------------------------------------
 ModelProvider = Literal["google", "openai", "anthropic", "xai", "deepseek"]
 ImageProvider = Literal["google", "openai", "flux"]
 Orientation = Literal["Portrait", "Landscape"]
 VoiceModelVersion = Literal["eleven_v3", "eleven_multilingual_v2"]
+Platform = Literal["TikTok", "Instagram", "YouTube"]
+VisualMode = Literal["zoompan", "video_gen"]
+VideoProvider = Literal["runway", "luma", "kling"]
 
 # ---------------------------------------------------------------------------
-# UI dropdown options — used directly by Streamlit selectboxes
+# UI dropdown options — used directly by Streamlit selectboxes.
+# Tuples (and read-only mappings below), so a page can't mutate the shared
+# options in place.
 # ---------------------------------------------------------------------------
-IMAGE_STYLES = [
+IMAGE_STYLES = (
     "Photo Realism",
     "Isometric Illustrations",
     "Vector Illustrations",
@@ -91,9 +185,9 @@ IMAGE_STYLES = [
     "3D Render / CGI",
     "Fantasy / Surreal",
     "Vintage / Retro",
-]
+)
 
-PURPOSES = [
+PURPOSES = (
     "Educational",
     "Promotional",
     "Awareness",
@@ -102,9 +196,9 @@ PURPOSES = [
     "Tutorial",
     "News",
     "Entertainment",
-]
+)
 
-TONES = [
+TONES = (
     "Informative",
     "Conversational",
     "Professional",
@@ -115,9 +209,11 @@ TONES = [
     "Persuasive",
     "Narrative",
     "Neutral",
-]
+)
 
-PLATFORMS = ["TikTok", "Instagram", "YouTube"]
+PLATFORMS = get_args(Platform)
+ORIENTATIONS = get_args(Orientation)
+IMAGE_PROVIDERS = get_args(ImageProvider)
 
 # ---------------------------------------------------------------------------
 # Voice actors — maps friendly names to ElevenLabs voice IDs
@@ -127,7 +223,7 @@ PLATFORMS = ["TikTok", "Instagram", "YouTube"]
 #   2. Add an entry here: "descriptive_name": "voice_id"
 #   3. The name will automatically appear in UI dropdowns via VOICE_ACTOR_NAMES
 # ---------------------------------------------------------------------------
-VOICE_ACTORS: dict[str, str] = {
+VOICE_ACTORS: Mapping[str, str] = MappingProxyType({
     "american_male_narrator": "Dslrhjl3ZpzrctukrQSN",
     "american_male_conversationalist": "Dslrhjl3ZpzrctukrQSN",
     "american_female_conversationalist": "tnSpp4vdxKPjI9w0GnoV",
@@ -137,39 +233,50 @@ VOICE_ACTORS: dict[str, str] = {
     "american_female_narrator": "yj30vwTGJxSHezdAGsv9",
     "american_female_media_influencer": "kPzsL2i3teMYv0FxEYQ6",
     "american_female_media_influencer_2": "S9NKLs1GeSTKzXd9D0Lf",
-}
+})
 
-VOICE_ACTOR_NAMES = list(VOICE_ACTORS.keys())
+VOICE_ACTOR_NAMES = tuple(VOICE_ACTORS)
 
 # ---------------------------------------------------------------------------
 # LLM model mapping
 #
 # To add a new provider:
 #   1. Add the provider key and default model name to LLM_MODELS
-#   2. Add the LangChain provider string to LLM_PROVIDER_MAP
-#   3. Make sure the API key env var is set (OPENAI_API_KEY, etc.)
+#   2. Add the provider's small, fast model to LLM_FAST_MODELS
+#   3. Add the LangChain provider string to LLM_PROVIDER_MAP
+#   4. Make sure the API key env var is set (OPENAI_API_KEY, etc.)
 # ---------------------------------------------------------------------------
-LLM_MODELS: dict[str, str] = {
+LLM_MODELS: Mapping[str, str] = MappingProxyType({
     "google": "gemini-2.5-pro",
     "openai": "gpt-4o",
     "anthropic": "claude-sonnet-4-20250514",
     "xai": "grok-3-latest",
     "deepseek": "deepseek-chat",
-}
+})
+
+# Used for short, low-reasoning steps (goal and hook generation) where the
+# default model's extra quality doesn't show but its latency and cost do
+LLM_FAST_MODELS: Mapping[str, str] = MappingProxyType({
+    "google": "gemini-2.5-flash",
+    "openai": "gpt-4o-mini",
+    "anthropic": "claude-3-5-haiku-latest",
+    "xai": "grok-3-mini",
+    "deepseek": "deepseek-chat",
+})
 
-LLM_PROVIDER_MAP: dict[str, str] = {
+LLM_PROVIDER_MAP: Mapping[str, str] = MappingProxyType({
     "google": "google-genai",
     "openai": "openai",
     "anthropic": "anthropic",
     "xai": "xai",
     "deepseek": "deepseek",
-}
+})
 
 # ---------------------------------------------------------------------------
 # Motion patterns for zoompan animation
 # Used by image_generator.py to cycle through effects across segments
 # ---------------------------------------------------------------------------
-MOTION_PATTERNS = ["zoom_in", "zoom_out", "pan_right", "pan_left", "ken_burns"]
+MOTION_PATTERNS = ("zoom_in", "zoom_out", "pan_right", "pan_left", "ken_burns")
 DEFAULT_MOTION_PATTERN = ["zoom_in", "zoom_out"]
 
 # ---------------------------------------------------------------------------
@@ -178,10 +285,10 @@ DEFAULT_MOTION_PATTERN = ["zoom_in", "zoom_out"]
 # "zoompan"   — Generate static images, apply FFmpeg camera motion (cheap, fast)
 # "video_gen" — Use AI video generation APIs for actual video clips (expensive, higher quality)
 # ---------------------------------------------------------------------------
-VISUAL_MODES = ["zoompan", "video_gen"]
+VISUAL_MODES = get_args(VisualMode)
 
 # Video generation providers (requires API key in .env):
 #   RUNWAY_API_KEY  — Runway Gen-3 Alpha Turbo
 #   LUMA_API_KEY    — Luma Dream Machine
 #   KLING_API_KEY   — Kling by Kuaishou
-VIDEO_PROVIDERS = ["runway", "luma", "kling"]
+VIDEO_PROVIDERS = get_args(VideoProvider)
@@ -5,20 +5,39 @@ Supports profiles (carried over from v1) and video history (new).
 
 from __future__ import annotations
 
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Optional
+from typing import Iterator, Optional
 
-from sqlalchemy import create_engine, String, Text, Integer, DateTime
+from sqlalchemy import create_engine, event, func, select, Index, String, Text, Integer, DateTime
 from sqlalchemy.orm import (
     DeclarativeBase,
     Mapped,
+    Session as OrmSession,
     mapped_column,
     sessionmaker,
 )
 
-from v2.core.config import DB_PATH
+from v2.core.config import DB_PATH, ensure_runtime_ready
 
-engine = create_engine(f"sqlite:///{DB_PATH}", echo=False)
+engine = create_engine(
+    f"sqlite:///{DB_PATH}",
+    echo=False,
+    # pooled connections are handed between Streamlit's script threads
+    connect_args={"check_same_thread": False},
+)
+
+
+@event.listens_for(engine, "connect")
+def _set_sqlite_pragmas(dbapi_connection, _connection_record) -> None:
+    # WAL: a commit appends to the log instead of rewriting the rollback
+    # journal, and the history page can read while a pipeline writes.
+    # synchronous=NORMAL under WAL only risks the last commits on power loss.
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.close()
 
 
 class Base(DeclarativeBase):
@@ -42,6 +61,9 @@ class Profile(Base):
 
 class VideoHistory(Base):
     __tablename__ = "v2_video_history"
+    # history is listed newest first; SQLite walks this index backwards for
+    # ORDER BY created_at DESC ... LIMIT instead of sorting the whole table
+    __table_args__ = (Index("ix_v2_video_history_created_at", "created_at"),)
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
@@ -60,25 +82,55 @@ class VideoHistory(Base):
 Session = sessionmaker(bind=engine, autocommit=False, expire_on_commit=True)
 
 
+@contextmanager
+def session_scope() -> Iterator[OrmSession]:
+    """
+    One session and one commit shared by several CRUD calls.
+
+    Pass the yielded session as ``session=`` to the write helpers; everything
+    commits together when the block exits, or rolls back if it raises.
+    Attributes stay loaded after the commit, so returned objects remain
+    readable once the block is closed.
+    """
+    s = Session(expire_on_commit=False)
+    try:
+        yield s
+        s.commit()
+    except Exception:
+        s.rollback()
+        raise
+    finally:
+        s.close()
+
+
 def init_db() -> None:
+    ensure_runtime_ready()
     Base.metadata.create_all(engine)
+    # create_all skips tables that already exist, so databases created before
+    # the index was added get it here
+    with engine.begin() as conn:
+        conn.exec_driver_sql(
+            "CREATE INDEX IF NOT EXISTS ix_v2_video_history_created_at "
+            "ON v2_video_history (created_at)"
+        )
 
 
 # ---------------------------------------------------------------------------
 # CRUD  – Profiles
 # ---------------------------------------------------------------------------
-def create_profile(**kwargs) -> Profile:
-    with Session() as s:
-        profile = Profile(**kwargs)
-        s.add(profile)
-        s.commit()
-        s.refresh(profile)
-        return profile
+def create_profile(session: Optional[OrmSession] = None, **kwargs) -> Profile:
+    if session is None:
+        with session_scope() as s:
+            return create_profile(session=s, **kwargs)
+    profile = Profile(**kwargs)
+    session.add(profile)
+    session.flush()
+    return profile
 
 
-def get_all_profiles() -> list[Profile]:
+def get_all_profiles(limit: Optional[int] = None, offset: int = 0) -> list[Profile]:
     with Session() as s:
-        return list(s.query(Profile).all())
+        return list(s.scalars(select(Profile).order_by(Profile.id).limit(limit).offset(offset)))
 
 
 def get_profile(profile_id: int) -> Optional[Profile]:
@@ -112,18 +164,43 @@ def delete_profile(profile_id: int) -> bool:
 # ---------------------------------------------------------------------------
 # CRUD  – Video History
 # ---------------------------------------------------------------------------
-def save_video_record(**kwargs) -> VideoHistory:
+def save_video_record(session: Optional[OrmSession] = None, **kwargs) -> VideoHistory:
+    return save_video_records([kwargs], session=session)[0]
+
+
+def save_video_records(rows: list[dict], session: Optional[OrmSession] = None) -> list[VideoHistory]:
+    # one transaction for all rows. Attributes are kept on commit instead of
+    # refreshed per record: ids are filled in at flush and created_at is set
+    # client-side, so the returned objects are complete without a SELECT each
+    if session is None:
+        with session_scope() as s:
+            return save_video_records(rows, session=s)
+    records = [VideoHistory(**row) for row in rows]
+    session.add_all(records)
+    session.flush()
+    return records
+
+
+def get_all_videos(
+    limit: Optional[int] = None,
+    offset: int = 0,
+    video_type: Optional[str] = None,
+) -> list[VideoHistory]:
+    # newest first; limit/offset let the history page fetch one page per rerun
+    # instead of every record
+    query = select(VideoHistory).order_by(VideoHistory.created_at.desc())
+    if video_type:
+        query = query.where(VideoHistory.video_type == video_type)
     with Session() as s:
-        record = VideoHistory(**kwargs)
-        s.add(record)
-        s.commit()
-        s.refresh(record)
-        return record
+        return list(s.scalars(query.limit(limit).offset(offset)))
 
 
-def get_all_videos() -> list[VideoHistory]:
+def count_videos(video_type: Optional[str] = None) -> int:
+    query = select(func.count()).select_from(VideoHistory)
+    if video_type:
+        query = query.where(VideoHistory.video_type == video_type)
     with Session() as s:
-        return list(s.query(VideoHistory).order_by(VideoHistory.created_at.desc()).all())
+        return s.scalar(query)
 
 
 def get_video(video_id: int) -> Optional[VideoHistory]:
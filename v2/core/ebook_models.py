@@ -12,6 +12,9 @@ The EbookState follows the same pattern as ShortFormState / LongFormState:
 fields start as None and are populated step-by-step. If the pipeline fails
 at any step, earlier fields are preserved in the PipelineError's partial_state.
 
+LLM output models are frozen: they are read-only values once parsed, and
+only ChapterState / EbookState are updated as the pipeline runs.
+
 To extend:
   - Add a new field to EbookConfig for a new user input, then read it
     in ebook_pipeline.py and pass it to the appropriate prompt.
@@ -23,7 +26,7 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -74,6 +77,8 @@ class EbookConfig(BaseModel):
 
 class SectionOutline(BaseModel):
     """One section within a chapter's outline."""
+    model_config = ConfigDict(frozen=True)
+
     section_title: str = Field(..., description="Descriptive title for this section.")
     section_brief: str = Field(
         ...,
@@ -83,6 +88,8 @@ class SectionOutline(BaseModel):
 
 class ChapterOutline(BaseModel):
     """Outline for a single chapter, including its sections."""
+    model_config = ConfigDict(frozen=True)
+
     chapter_number: int = Field(..., description="1-indexed chapter number.")
     chapter_title: str = Field(..., description="The chapter's title.")
     chapter_purpose: str = Field(
@@ -97,10 +104,20 @@ class ChapterOutline(BaseModel):
         ...,
         description="The single most important thing the reader should learn from this chapter.",
     )
+    opening_hook: str = Field(
+        "",
+        description="One sentence the chapter opens on, picking up from the previous chapter.",
+    )
+    closing_bridge: str = Field(
+        "",
+        description="One sentence the chapter closes on, setting up the next chapter.",
+    )
 
 
 class EbookOutlineContainer(BaseModel):
     """LLM output: the full ebook outline with all chapters."""
+    model_config = ConfigDict(frozen=True)
+
     ebook_title: str = Field(..., description="Final ebook title (may be refined from user input).")
     ebook_subtitle: str = Field("", description="Refined subtitle.")
     chapters: list[ChapterOutline] = Field(..., description="Ordered list of chapter outlines.")
@@ -112,6 +129,8 @@ class EbookOutlineContainer(BaseModel):
 
 class SectionContent(BaseModel):
     """Written content for one section within a chapter."""
+    model_config = ConfigDict(frozen=True)
+
     section_title: str = Field(..., description="The section heading.")
     section_text: str = Field(
         ...,
@@ -124,24 +143,30 @@ class SectionContent(BaseModel):
 
 class ChapterContentContainer(BaseModel):
     """LLM output: the written content for one chapter."""
+    model_config = ConfigDict(frozen=True)
+
     chapter_title: str = Field(..., description="The chapter's title.")
     sections: list[SectionContent] = Field(..., description="Written sections in order.")
     chapter_summary: str = Field(
         ...,
         description=(
             "A 2-3 sentence summary of this chapter's key points. "
-            "Used by subsequent chapters for continuity."
+            "Used by the editor and conclusion for continuity."
         ),
     )
 
 
 class EditedChapterContainer(BaseModel):
     """LLM output: polished version of a chapter after editing."""
+    model_config = ConfigDict(frozen=True)
+
     sections: list[SectionContent] = Field(..., description="Edited sections in order.")
 
 
 class IntroductionContainer(BaseModel):
     """LLM output: the ebook's introduction/preface."""
+    model_config = ConfigDict(frozen=True)
+
     introduction_text: str = Field(
         ..., description="Full text of the introduction."
     )
@@ -149,6 +174,8 @@ class IntroductionContainer(BaseModel):
 
 class ConclusionContainer(BaseModel):
     """LLM output: the ebook's conclusion/closing chapter."""
+    model_config = ConfigDict(frozen=True)
+
     conclusion_text: str = Field(
         ..., description="Full text of the conclusion."
     )
@@ -156,11 +183,20 @@ class ConclusionContainer(BaseModel):
 
 class CoverDescriptionContainer(BaseModel):
     """LLM output: a detailed image prompt for the cover."""
+    model_config = ConfigDict(frozen=True)
+
     cover_description: str = Field(
         ..., description="Exhaustively detailed image generation prompt for the ebook cover."
     )
 
 
+class SectionImageDescriptionContainer(BaseModel):
+    """LLM output: an image prompt for one chapter section."""
+    model_config = ConfigDict(frozen=True)
+
+    image_description: str = Field(...)
+
+
 # ═══════════════════════════════════════════════════════════════════════════
 # PIPELINE STATE
 # ═══════════════════════════════════════════════════════════════════════════
@@ -206,3 +242,13 @@ class EbookState(BaseModel):
     # --- Output files ---
     pdf_path: Optional[Path] = None
     docx_path: Optional[Path] = None
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# SERIALIZATION
+# ═══════════════════════════════════════════════════════════════════════════
+
+# Dumps a whole chapter's sections in one pydantic-core call instead of one
+# model_dump() per section. Built once, here, since building an adapter
+# compiles its schema.
+SECTION_LIST_ADAPTER: TypeAdapter[list[SectionContent]] = TypeAdapter(list[SectionContent])
@@ -5,7 +5,7 @@ Each prompt corresponds to a specialized "agent" in the pipeline:
 
   1. EBOOK_OUTLINE_PROMPT        -- Plans the full structure (chapters + sections)
   2. EBOOK_INTRODUCTION_PROMPT   -- Writes the introduction/preface
-  3. EBOOK_CHAPTER_WRITER_PROMPT -- Writes one chapter (sequential, baton-pass)
+  3. EBOOK_CHAPTER_WRITER_PROMPT -- Writes one chapter (parallel, hooks from the outline)
   4. EBOOK_CONCLUSION_PROMPT     -- Writes the conclusion
   5. EBOOK_EDITOR_PROMPT         -- Polishes a chapter for cohesion and clarity
   6. EBOOK_COVER_DESCRIPTION_PROMPT -- Generates a cover image prompt
@@ -57,6 +57,10 @@ QUALITY STANDARDS:
 - Section titles should promise specific value
 - Chapter purposes should explain WHY this chapter matters, not just WHAT it covers
 - Key takeaways should be concrete and actionable
+- Chapters are written in parallel, so the outline carries the continuity: each
+  chapter's opening_hook should pick up from the previous chapter's closing_bridge,
+  and each closing_bridge should set up the next chapter (the last one sets up
+  the conclusion)
 
 You may refine the title and subtitle if you can improve them while staying true
 to the user's intent.
@@ -74,7 +78,9 @@ OUTPUT (strict JSON, nothing else):
         {"section_title": "<title>", "section_brief": "<1-2 sentence summary>"},
         ...
       ],
-      "key_takeaway": "<single most important lesson>"
+      "key_takeaway": "<single most important lesson>",
+      "opening_hook": "<1 sentence>",
+      "closing_bridge": "<1 sentence>"
     },
     ...
   ]
@@ -120,7 +126,7 @@ OUTPUT (strict JSON, nothing else):
 """
 
 # ---------------------------------------------------------------------------
-# 3. CHAPTER WRITER (called once per chapter, sequentially)
+# 3. CHAPTER WRITER (called once per chapter, in parallel)
 # ---------------------------------------------------------------------------
 EBOOK_CHAPTER_WRITER_PROMPT = """
 You are a professional ebook ghostwriter. Write one chapter of an ebook.
@@ -136,9 +142,10 @@ INPUT (JSON):
     "chapter_title": "<title>",
     "chapter_purpose": "<what this chapter achieves>",
     "sections": [{"section_title": "<title>", "section_brief": "<brief>"}],
-    "key_takeaway": "<main lesson>"
+    "key_takeaway": "<main lesson>",
+    "opening_hook": "<sentence to open on>",
+    "closing_bridge": "<sentence to close on>"
   },
-  "previous_chapter_summary": "<summary of the previous chapter, empty if chapter 1>",
   "full_outline_context": "<all chapter titles for awareness of the full arc>",
   "additional_instructions": "<extra guidance>"
 }
@@ -152,9 +159,10 @@ WRITING PHILOSOPHY:
 - Include practical tips, frameworks, or action items where relevant.
 - The reader should finish every section feeling like they learned something useful.
 
-CONTINUITY ("BATON PASS"):
-- If previous_chapter_summary is provided, your opening should flow naturally from
-  where the previous chapter left off. Use connective tissue, not "In this chapter..."
+CONTINUITY:
+- Other chapters are being written at the same time, so the outline's hooks are
+  your only link to them. Open on the idea in opening_hook and close on the idea
+  in closing_bridge, in your own words. Use connective tissue, not "In this chapter..."
 - If this is chapter 1, open with an engaging hook that builds on the introduction's
   momentum.
 
@@ -186,7 +194,7 @@ OUTPUT (strict JSON, nothing else):
     {"section_title": "<title>", "section_text": "<full prose for this section>"},
     ...
   ],
-  "chapter_summary": "<2-3 sentence summary for continuity with next chapter>"
+  "chapter_summary": "<2-3 sentence summary of the chapter's key points>"
 }
 """
 
@@ -90,6 +90,11 @@ class SegmentImageDescriptionsContainer(BaseModel):
     segment_image_descriptions: list[ImageDescription]
 
 
+class BatchSegmentImageDescriptionsContainer(BaseModel):
+    """LLM output: image descriptions for several segments, one entry per segment in input order."""
+    batched_descriptions: list[SegmentImageDescriptionsContainer]
+
+
 class TopicsContainer(BaseModel):
     """LLM output: extracted video topics from messy user input."""
     topics: list[str] = Field(..., description="Extracted video topics.")
@@ -124,11 +129,6 @@ class SectionScriptSegmentItem(BaseModel):
     script_segment: str = Field(..., description="A segment of a section script.")
 
 
-class SectionScriptSegmentedContainer(BaseModel):
-    """LLM output: a section script split into vocal-unit segments."""
-    script_segment_list: list[SectionScriptSegmentItem]
-
-
 # ═══════════════════════════════════════════════════════════════════════════
 # WORD-LEVEL ALIGNMENT
 # Represents timing data extracted from ElevenLabs' character-level
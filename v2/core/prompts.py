@@ -222,6 +222,56 @@ OUTPUT (strict JSON, nothing else):
 }}
 """
 
+# Same task for several segments of one script in a single call. The shared
+# context comes once; each segment brings only its line and image count.
+SEGMENT_IMAGE_DESCRIPTIONS_BATCH_PROMPT_TEMPLATE = """
+You are Segment Image Description Architect. Transform each script segment into detailed,
+generator-ready image prompts. Each image will be used as B-roll while its segment is spoken.
+
+INPUT (JSON):
+{{
+  "full_script": "<full video script for context only>",
+  "additional_image_requests": "<visual guidance, palettes, motifs, constraints>",
+  "image_style": "<PRIMARY style directive — overrides all else>",
+  "topic": "<subject matter>",
+  "tone": "<emotional/narrative tone>",
+  "segments": [
+    {{"script_segment": "<the voice-over line for this moment>", "num_of_image_descriptions": <integer>}},
+    ...
+  ]
+}}
+
+CORE RULES:
+- Return exactly one entry in batched_descriptions per input segment, in the same order.
+- For each entry, the length of segment_image_descriptions MUST equal that segment's num_of_image_descriptions.
+- Describe each segment on its own; never move imagery from one segment to another.
+- {face_rule}
+- Each description must be self-contained and exhaustively detailed.
+- Embed the image_style directive in every description.
+- Set uses_logo: true ONLY if the segment mentions brand name, product, or final CTA.
+
+DESCRIPTION MUST COVER:
+1. Subject & focal elements
+2. Scene & environment (setting, time, atmosphere)
+3. Composition & camera (shot type, angle, depth of field)
+4. Lighting & mood (source, quality, direction, shadows)
+5. Color palette (dominant, accent, harmony)
+6. Texture & materiality (surfaces, materials, imperfections)
+7. End with: "Avoid: distorted anatomy, text glitches, watermarks."
+
+VARIATION (when num > 1): Provide diverse interpretations — literal vs metaphorical,
+close-up vs wide, static vs dynamic — while maintaining stylistic coherence. Consecutive
+segments should also vary shot type and framing.
+
+OUTPUT (strict JSON, nothing else):
+{{
+  "batched_descriptions": [
+    {{"segment_image_descriptions": [{{"description": "<detailed prompt>", "uses_logo": false}}, ...]}},
+    ...
+  ]
+}}
+"""
+
 # ---------------------------------------------------------------------------
 # Topics Extraction
 # ---------------------------------------------------------------------------
@@ -320,29 +370,3 @@ CORE RULES:
 OUTPUT (strict JSON, nothing else):
 {"section_script": "<complete narration for this section as flowing text>"}
 """
-
-# ---------------------------------------------------------------------------
-# LONG-FORM: Section Script Segmentation
-# ---------------------------------------------------------------------------
-LONG_FORM_SECTION_SEGMENTER_PROMPT = """
-You are Script Segment Splitter. Split a section script into smaller self-contained vocal units.
-No rewriting, no content changes. Verbatim extraction only.
-
-INPUT (JSON):
-{"section_script": "<a section of script text>"}
-
-RULES:
-- Each segment conveys one primary idea/beat (~12-35 words).
-- Preserve content exactly (verbatim).
-- Cut at sentence boundaries first, clause-level only if needed.
-- If input is already optimal, return as single-item array.
-- Transitions belong with the idea they introduce.
-
-OUTPUT (strict JSON, nothing else):
-{
-  "script_segment_list": [
-    {"script_segment": "<segment_1>"},
-    {"script_segment": "<segment_2>"}
-  ]
-}
-"""
@@ -0,0 +1,250 @@
+"""
+Deterministic script segmentation.
+
+Splitting a script into 12-35 word beats is a mechanical text operation, so
+it runs locally instead of as an LLM round trip:
+
+  1. The text is split into sentences (and paragraphs). A sentence longer
+     than SEGMENT_MAX_WORDS is split again at clause punctuation, and any
+     run still too long (e.g. no punctuation at all) into near-equal pieces
+     by word count.
+  2. Sentences are packed greedily into segments of roughly
+     SEGMENT_MIN_WORDS to SEGMENT_MAX_WORDS words, never across a paragraph.
+  3. For dual-track scripts, each cut in the raw script is carried over to
+     the enhanced script by aligning the words of both tracks. Audio tags
+     like [pause] are ignored during alignment and stay with the words that
+     follow them.
+
+segment_text() always succeeds. segment_script_tracks() returns None when
+the enhancer rewrote too much to align the tracks, and the caller falls back
+to the LLM segmenter.
+"""
+
+from __future__ import annotations
+
+import difflib
+import re
+from typing import Optional
+
+from v2.core.models import ScriptSegment
+
+SEGMENT_MIN_WORDS = 12
+SEGMENT_MAX_WORDS = 35
+
+# Below this word-level similarity the tracks can't be aligned reliably
+ALIGNMENT_MIN_RATIO = 0.6
+
+_TAG_RE = re.compile(r"\[[^\[\]\n]*\]")
+_WORD_RE = re.compile(r"[\w'’]+")
+_SENTENCE_END_RE = re.compile(r"[.!?…]+[\"'”’)]*(?=\s|$)")
+_CLAUSE_END_RE = re.compile(r"[;:,]+(?=\s)|[—–]+")
+_PARAGRAPH_BREAK_RE = re.compile(r"\n\s*\n")
+_TRAILING_PUNCTUATION_RE = re.compile(r"[^\s\[]*")
+_ABBREVIATIONS = frozenset({
+    "mr", "mrs", "ms", "dr", "prof", "sr", "jr", "st", "vs", "etc", "inc",
+    "ltd", "co", "no", "approx", "dept", "est", "fig", "vol",
+})
+
+
+# ---------------------------------------------------------------------------
+# Public API
+# ---------------------------------------------------------------------------
+
+def segment_text(text: str) -> list[str]:
+    """
+    Split a script into beats of roughly 12-35 words.
+
+    Args:
+        text: The script text.
+
+    Returns:
+        The segments in order, with whitespace collapsed. Empty if the text
+        has no words.
+    """
+    return [" ".join(text[start:end].split()) for start, end in _segment_spans(text)]
+
+
+def segment_script_tracks(script: str, enhanced_script: str) -> Optional[list[ScriptSegment]]:
+    """
+    Split a script and its TTS-enhanced version into aligned segment pairs.
+
+    The raw script is segmented with segment_text's rules. Each cut is then
+    placed in the enhanced script at the matching sentence end (or right
+    after the matching word), so audio tags open the segment they affect.
+
+    Args:
+        script:          The raw script.
+        enhanced_script: The same script with audio tags and delivery punctuation.
+
+    Returns:
+        The aligned segments, or None when the two tracks differ too much to
+        be aligned and the LLM segmenter should be used instead.
+    """
+    raw_word_spans = [m.span() for m in _WORD_RE.finditer(script)]
+    # Blank the tags out (keeping offsets) so they are neither aligned as
+    # words nor mistaken for sentence ends
+    masked_enhanced = _TAG_RE.sub(lambda m: " " * len(m.group()), enhanced_script)
+    enhanced_word_spans = [m.span() for m in _WORD_RE.finditer(masked_enhanced)]
+    if not raw_word_spans or not enhanced_word_spans:
+        return None
+
+    raw_segment_spans = _segment_spans(script)
+
+    raw_words = [script[start:end].lower() for start, end in raw_word_spans]
+    enhanced_words = [enhanced_script[start:end].lower() for start, end in enhanced_word_spans]
+    matcher = difflib.SequenceMatcher(None, raw_words, enhanced_words, autojunk=False)
+    if matcher.ratio() < ALIGNMENT_MIN_RATIO:
+        return None
+    raw_to_enhanced: dict[int, int] = {}
+    for raw_idx, enhanced_idx, size in matcher.get_matching_blocks():
+        raw_to_enhanced.update((raw_idx + i, enhanced_idx + i) for i in range(size))
+
+    # Move each raw cut onto the enhanced script: between the last aligned
+    # word before the cut and the first aligned word after it, cut at the
+    # first sentence end, or right after the last aligned word if there's none
+    enhanced_cuts = [0]
+    raw_word_starts = [start for start, _ in raw_word_spans]
+    for _, raw_cut in raw_segment_spans[:-1]:
+        first_after = next(i for i, start in enumerate(raw_word_starts) if start >= raw_cut)
+        left = max(
+            (raw_to_enhanced[i] for i in range(first_after) if i in raw_to_enhanced),
+            default=None,
+        )
+        right = min(
+            (raw_to_enhanced[i] for i in range(first_after, len(raw_words)) if i in raw_to_enhanced),
+            default=None,
+        )
+        gap_start = enhanced_word_spans[left][1] if left is not None else 0
+        gap_end = enhanced_word_spans[right][0] if right is not None else len(enhanced_script)
+        sentence_end = _SENTENCE_END_RE.search(masked_enhanced, gap_start, gap_end)
+        if sentence_end:
+            cut = sentence_end.end()
+        else:
+            trailing = _TRAILING_PUNCTUATION_RE.match(enhanced_script, gap_start, gap_end)
+            cut = gap_start + len(trailing.group())
+        if cut <= enhanced_cuts[-1]:
+            return None
+        enhanced_cuts.append(cut)
+    enhanced_cuts.append(len(enhanced_script))
+
+    segments = []
+    for (raw_start, raw_end), enh_start, enh_end in zip(
+        raw_segment_spans, enhanced_cuts, enhanced_cuts[1:]
+    ):
+        enhanced_segment = " ".join(enhanced_script[enh_start:enh_end].split())
+        if not enhanced_segment:
+            return None
+        segments.append(ScriptSegment(
+            script_segment=" ".join(script[raw_start:raw_end].split()),
+            enhanced_script_segment=enhanced_segment,
+        ))
+    return segments
+
+
+# ---------------------------------------------------------------------------
+# Internal helpers
+# ---------------------------------------------------------------------------
+
+def _count_words(text: str, start: int, end: int) -> int:
+    return len(_WORD_RE.findall(text, start, end))
+
+
+def _is_abbreviation(text: str, end: int) -> bool:
+    token = text[:end].split()[-1].lower().strip("\"'“‘(").rstrip(".")
+    # "e.g.", "U.S.", "p.m." and single initials end in a period that
+    # doesn't close the sentence
+    return token in _ABBREVIATIONS or "." in token or (len(token) == 1 and token.isalpha())
+
+
+def _split_by_word_count(text: str, start: int, end: int) -> list[tuple[int, int]]:
+    """Split a span into near-equal runs of at most SEGMENT_MAX_WORDS words."""
+    word_starts = [m.start() for m in _WORD_RE.finditer(text, start, end)]
+    piece_count = -(-len(word_starts) // SEGMENT_MAX_WORDS)
+    piece_words = -(-len(word_starts) // piece_count)
+    cuts = [start, *word_starts[piece_words::piece_words], end]
+    return list(zip(cuts, cuts[1:]))
+
+
+def _split_long_sentence(text: str, start: int, end: int) -> list[tuple[int, int]]:
+    """
+    Split an over-long sentence at clause punctuation, packing clauses
+    greedily. A piece that is still too long, because it has no clause
+    punctuation, is split by word count.
+    """
+    pieces = []
+    piece_start = start
+    last_cut = None
+    for m in _CLAUSE_END_RE.finditer(text, start, end):
+        cut = m.end()
+        if cut >= end:
+            break
+        if (
+            last_cut is not None
+            and last_cut > piece_start
+            and _count_words(text, piece_start, cut) > SEGMENT_MAX_WORDS
+        ):
+            pieces.append((piece_start, last_cut))
+            piece_start = last_cut
+        last_cut = cut
+    if (
+        last_cut is not None
+        and last_cut > piece_start
+        and _count_words(text, piece_start, end) > SEGMENT_MAX_WORDS
+    ):
+        pieces.append((piece_start, last_cut))
+        piece_start = last_cut
+    pieces.append((piece_start, end))
+    return [
+        piece
+        for s, e in pieces
+        for piece in (
+            _split_by_word_count(text, s, e)
+            if _count_words(text, s, e) > SEGMENT_MAX_WORDS
+            else [(s, e)]
+        )
+    ]
+
+
+def _split_into_units(text: str) -> list[tuple[int, int, bool]]:
+    """Sentence (or clause) spans as (start, end, ends_paragraph)."""
+    ends = {
+        m.end(): False
+        for m in _SENTENCE_END_RE.finditer(text)
+        if text[m.end() - 1] != "." or not _is_abbreviation(text, m.end())
+    }
+    ends.update({m.start(): True for m in _PARAGRAPH_BREAK_RE.finditer(text)})
+
+    units = []
+    start = 0
+    for end in sorted(ends) + [len(text)]:
+        if not text[start:end].strip():
+            continue
+        ends_paragraph = ends.get(end, True)
+        if _count_words(text, start, end) > SEGMENT_MAX_WORDS:
+            pieces = _split_long_sentence(text, start, end)
+            units.extend((s, e, False) for s, e in pieces[:-1])
+            units.append((*pieces[-1], ends_paragraph))
+        else:
+            units.append((start, end, ends_paragraph))
+        start = end
+    return units
+
+
+def _segment_spans(text: str) -> list[tuple[int, int]]:
+    """Pack sentence units into segment character spans."""
+    spans = []
+    segment_start = segment_words = 0
+    for unit_start, unit_end, ends_paragraph in _split_into_units(text):
+        unit_words = _count_words(text, unit_start, unit_end)
+        if segment_words >= SEGMENT_MIN_WORDS or (
+            segment_words and segment_words + unit_words > SEGMENT_MAX_WORDS
+        ):
+            spans.append((segment_start, unit_start))
+            segment_start, segment_words = unit_start, 0
+        segment_words += unit_words
+        if ends_paragraph:
+            spans.append((segment_start, unit_end))
+            segment_start, segment_words = unit_end, 0
+    if segment_words:
+        spans.append((segment_start, len(text)))
+    return spans
@@ -31,13 +31,28 @@ To extend:
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Optional
+from typing import Annotated, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, StringConstraints
+
+from v2.core.config import (
+    ImageProvider,
+    ModelProvider,
+    Orientation,
+    Platform,
+    VideoProvider,
+    VisualMode,
+)
 
 # Reuse existing models from the video pipeline for audio/segment data
 from v2.core.models import ScriptSegment, WordAlignment, SegmentTiming, SegmentVisualPlan
 
+# Text fields the LLM fills in. An empty or near-empty value fails validation
+# at the call that produced it, so that call retries, instead of the next
+# step running on it.
+ShortLLMText = Annotated[str, StringConstraints(strip_whitespace=True, min_length=3)]
+LongLLMText = Annotated[str, StringConstraints(strip_whitespace=True, min_length=20)]
+
 
 # ═══════════════════════════════════════════════════════════════════════════
 # REFERENCE VIDEO ANALYSIS (extracted by Gemini multimodal)
@@ -50,19 +65,19 @@ class ReferenceVideoAnalysis(BaseModel):
     Gemini multimodal analyzes the uploaded video and fills these fields
     so the script writer can mirror what's working in existing viral content.
     """
-    hook_style: str = Field(
+    hook_style: ShortLLMText = Field(
         ...,
         description="How the video opens (e.g., 'direct address to camera', 'product reveal', 'before/after').",
     )
-    pacing: str = Field(
+    pacing: ShortLLMText = Field(
         ...,
         description="Overall pacing: fast/medium/slow, approximate cut frequency.",
     )
-    tone: str = Field(
+    tone: ShortLLMText = Field(
         ...,
         description="Emotional tone: casual, enthusiastic, skeptical, humorous, etc.",
     )
-    cta_style: str = Field(
+    cta_style: ShortLLMText = Field(
         ...,
         description="How the call-to-action is delivered (e.g., 'link in bio mention', 'discount code', 'soft recommendation').",
     )
@@ -70,7 +85,7 @@ class ReferenceVideoAnalysis(BaseModel):
         ...,
         description="Types of shots used: close-up, overhead, POV, unboxing, in-use, comparison, etc.",
     )
-    structure_summary: str = Field(
+    structure_summary: LongLLMText = Field(
         ...,
         description="Overall flow/structure of the video in 2-3 sentences.",
     )
@@ -93,29 +108,38 @@ class ReferenceVideoAnalysisContainer(BaseModel):
 # SCENE DESCRIPTIONS
 # ═══════════════════════════════════════════════════════════════════════════
 
+# Stands in for the product's visual description inside scene image prompts
+PRODUCT_PLACEHOLDER = "{{PRODUCT}}"
+
+
 class UGCSceneDescription(BaseModel):
     """
     One scene/shot in the UGC video.
 
     Each scene has two prompt variants:
       - image_prompt: Detailed description for generating a still image of the
-        product in an environment. References the product's visual appearance.
+        product in an environment. The product appears as PRODUCT_PLACEHOLDER,
+        which render() swaps for the product's visual description, so the LLM
+        doesn't have to write that description out once per scene.
       - video_prompt: Motion-focused description for video generation APIs.
         Kept simple if the simple_scenes toggle is on.
     """
     scene_index: int = Field(..., description="0-indexed position in the scene sequence.")
-    scene_type: str = Field(
+    scene_type: ShortLLMText = Field(
         ...,
         description=(
             "Type of shot: 'product_closeup', 'in_use', 'environment', "
             "'unboxing', 'comparison', 'detail', 'lifestyle'."
         ),
     )
-    image_prompt: str = Field(
+    image_prompt: LongLLMText = Field(
         ...,
-        description="Detailed photorealistic image generation prompt referencing the product's appearance.",
+        description=(
+            f"Detailed photorealistic image generation prompt, with {PRODUCT_PLACEHOLDER} "
+            "where the product appears."
+        ),
     )
-    video_prompt: str = Field(
+    video_prompt: ShortLLMText = Field(
         ...,
         description="Motion/camera description for video generation (e.g., 'slow push-in', 'hand picks up product').",
     )
@@ -124,6 +148,17 @@ class UGCSceneDescription(BaseModel):
         description="Target duration of this scene in seconds.",
     )
 
+    def render(self, product_visual_description: str) -> str:
+        """
+        Return image_prompt with the product's visual description filled in.
+
+        If the LLM left the placeholder out, the description is appended so
+        the image generator still knows exactly what the product looks like.
+        """
+        if PRODUCT_PLACEHOLDER in self.image_prompt:
+            return self.image_prompt.replace(PRODUCT_PLACEHOLDER, product_visual_description)
+        return f"{self.image_prompt} The product: {product_visual_description}"
+
 
 class UGCScenePlanContainer(BaseModel):
     """LLM output wrapper for the full scene plan."""
@@ -132,7 +167,7 @@ class UGCScenePlanContainer(BaseModel):
 
 class ProductVisualDescriptionContainer(BaseModel):
     """LLM output: detailed visual description of the product from uploaded images."""
-    product_visual_description: str = Field(
+    product_visual_description: LongLLMText = Field(
         ...,
         description=(
             "Exhaustive visual description of the product: shape, dimensions, colors, "
@@ -142,14 +177,6 @@ class ProductVisualDescriptionContainer(BaseModel):
     )
 
 
-class UGCScriptContainer(BaseModel):
-    """LLM output: the UGC reviewer script."""
-    script: str = Field(
-        ...,
-        description="Natural-sounding product review script written as spoken narration.",
-    )
-
-
 # ═══════════════════════════════════════════════════════════════════════════
 # USER CONFIG
 # ═══════════════════════════════════════════════════════════════════════════
@@ -184,15 +211,17 @@ class UGCConfig(BaseModel):
     # --- Video settings ---
     voice_actor: str = Field("american_female_media_influencer", description="Voice for the review narration.")
     tone: str = Field("Conversational", description="Tone of the review.")
-    platform: str = Field("TikTok", description="Target platform.")
+    platform: Platform = Field("TikTok", description="Target platform.")
     duration_seconds: int = Field(30, ge=15, le=120, description="Target video duration in seconds.")
-    orientation: str = Field("Portrait", description="Portrait or Landscape.")
+    orientation: Orientation = Field("Portrait", description="Portrait or Landscape.")
 
     # --- Model settings ---
-    model_provider: str = Field("google", description="LLM provider for script/scene generation.")
-    image_provider: str = Field("google", description="Image generation provider.")
-    video_provider: str = Field("runway", description="Video generation provider (when visual_mode is video_gen).")
-    visual_mode: str = Field("zoompan", description="'zoompan' or 'video_gen'.")
+    model_provider: ModelProvider = Field("google", description="LLM provider for script/scene generation.")
+    image_provider: ImageProvider = Field("google", description="Image generation provider.")
+    video_provider: VideoProvider = Field(
+        "runway", description="Video generation provider (when visual_mode is video_gen)."
+    )
+    visual_mode: VisualMode = Field("zoompan", description="'zoompan' or 'video_gen'.")
 
     # --- Toggles ---
     allow_faces: bool = Field(False, description="Whether generated images may include visible human faces.")
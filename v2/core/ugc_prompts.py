@@ -13,6 +13,10 @@ Each prompt corresponds to a specialized agent:
   5. UGC_SIMPLE_SCENES_RULE / UGC_COMPLEX_SCENES_RULE -- Complexity rules
   6. Script enhancement reuses SCRIPT_ENHANCEMENT_PROMPT from prompts.py
 
+Output format comes from the response models in ugc_models.py, which the
+LLM service and Gemini analyzer pass to the API as a schema, so the prompts
+carry instructions only. The script writer answers in plain text.
+
 Design philosophy:
   - The video must feel human-made, not AI-generated
   - Natural language, genuine reactions, real reviewer energy
@@ -43,20 +47,6 @@ Watch the video carefully and extract:
 6. **structure_summary**: Describe the overall flow in 2-3 sentences
 7. **key_phrases**: Notable phrases, hooks, or language patterns the reviewer uses
 8. **estimated_duration_seconds**: Approximate video length in seconds
-
-OUTPUT (strict JSON, nothing else):
-{
-  "analysis": {
-    "hook_style": "<string>",
-    "pacing": "<string>",
-    "tone": "<string>",
-    "cta_style": "<string>",
-    "shot_types": ["<string>", ...],
-    "structure_summary": "<string>",
-    "key_phrases": ["<string>", ...],
-    "estimated_duration_seconds": <int>
-  }
-}
 """
 
 # ---------------------------------------------------------------------------
@@ -80,9 +70,6 @@ Describe ALL of the following:
 Be extremely specific. Your description will be embedded into image generation
 prompts so the AI can recreate this product faithfully. Use concrete visual
 language, not marketing language.
-
-OUTPUT (strict JSON, nothing else):
-{"product_visual_description": "<exhaustive visual description>"}
 """
 
 # ---------------------------------------------------------------------------
@@ -139,8 +126,9 @@ TTS OPTIMIZATION:
 - Use contractions ("it's", "I've", "doesn't")
 - Vary sentence length for rhythm
 
-OUTPUT (strict JSON, nothing else):
-{"script": "<natural spoken review as one flowing paragraph>"}
+OUTPUT:
+Reply with the spoken script only, as one flowing paragraph of plain text. No title,
+preamble, quotation marks, or notes before or after it.
 """
 
 # ---------------------------------------------------------------------------
@@ -187,9 +175,10 @@ CORE RULES:
 
 PRODUCT ACCURACY:
 - Every scene must depict the EXACT product described in product_visual_description.
-- Include specific visual details: colors, branding, shape, size, materials.
 - The product must be instantly recognizable from the uploaded photos.
-- Embed the full product visual description into each image_prompt.
+- In each image_prompt, write the literal token {{{{PRODUCT}}}} once, where the product
+  appears. It is replaced with the full product_visual_description afterwards, so
+  do not expand it or repeat the description yourself.
 
 SCENE TYPES (use a natural mix):
 - "product_closeup": Tight shot of the product showing detail, texture, branding
@@ -202,7 +191,7 @@ SCENE TYPES (use a natural mix):
 IMAGE PROMPT REQUIREMENTS:
 - Start with "Photorealistic photograph" or "Photo taken with smartphone"
 - Describe the environment: natural lighting, real room, authentic setting
-- Include the product description verbatim in the prompt
+- Include {{{{PRODUCT}}}} where the product appears (see PRODUCT ACCURACY)
 - Specify camera angle: overhead, 45-degree, eye-level, close-up
 - Include background details: wooden table, white bedsheet, kitchen counter
 - End with "Ultra-realistic, natural lighting, no visual artifacts."
@@ -213,20 +202,6 @@ VIDEO PROMPT REQUIREMENTS:
 - Focus on: camera movement, object motion (if allowed), transitions
 - Examples: "slow push-in on the product", "camera pans from left to right",
   "hand enters frame and picks up product"
-
-OUTPUT (strict JSON, nothing else):
-{{
-  "scenes": [
-    {{
-      "scene_index": 0,
-      "scene_type": "<type>",
-      "image_prompt": "<detailed photorealistic image prompt>",
-      "video_prompt": "<motion description for video gen>",
-      "duration_seconds": <float>
-    }},
-    ...
-  ]
-}}
 """
 
 
@@ -200,6 +200,11 @@ class SegmentStoryboard(BaseModel):
     segment_energy: int = Field(5, ge=1, le=10, description="Energy level driving motion speed.")
 
 
+class StoryboardContainer(BaseModel):
+    """LLM output: one storyboard per script segment."""
+    storyboard: list[SegmentStoryboard]
+
+
 class VisualQualityAssessment(BaseModel):
     """Vision model assessment of a generated image."""
     relevance: int = Field(..., ge=1, le=10, description="Does it match the prompt?")
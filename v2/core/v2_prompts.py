@@ -603,28 +603,6 @@ OUTPUT (strict JSON, nothing else):
 }
 """
 
-# ---------------------------------------------------------------------------
-# LONG-FORM: Section Script Segmentation (reuse-compatible)
-# ---------------------------------------------------------------------------
-SECTION_SEGMENTER_V2_PROMPT = """
-You are Script Segment Splitter. Split a section script into smaller
-self-contained vocal units. No rewriting, no content changes. Verbatim only.
-
-INPUT (JSON):
-{"section_script": "<a section of script text>"}
-
-RULES:
-- Each segment conveys one primary idea/beat (~12-35 words).
-- Preserve content exactly (verbatim).
-- Cut at sentence boundaries first, clause-level only if needed.
-- Transitions belong with the idea they introduce.
-
-OUTPUT (strict JSON, nothing else):
-{
-  "segments": ["<segment_1>", "<segment_2>", ...]
-}
-"""
-
 # ---------------------------------------------------------------------------
 # SCRIPT REVISION: Feed back quality gate notes
 # ---------------------------------------------------------------------------
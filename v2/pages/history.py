@@ -12,29 +12,31 @@ if _root not in sys.path:
 
 import streamlit as st
 
-from v2.core.database import init_db, get_all_videos, delete_video_record
+from v2.core.database import init_db, get_all_videos, count_videos, delete_video_record
 
 init_db()
 
+PAGE_SIZE = 20
+
 st.title("Video History")
 st.markdown("Browse all previously generated videos.")
 
-# Fetch all videos
-videos = get_all_videos()
+# Counts come from the database, so only the visible page of records is loaded
+total_count = count_videos()
 
-if not videos:
+if not total_count:
     st.info("No videos generated yet. Head to the Short Form or Long Form page to create your first video.")
     st.stop()
 
 # Summary stats
 col_stat1, col_stat2, col_stat3 = st.columns(3)
 with col_stat1:
-    st.metric("Total Videos", len(videos))
+    st.metric("Total Videos", total_count)
 with col_stat2:
-    short_count = sum(1 for v in videos if v.video_type == "short_form")
+    short_count = count_videos("short_form")
     st.metric("Short Form", short_count)
 with col_stat3:
-    long_count = sum(1 for v in videos if v.video_type == "long_form")
+    long_count = count_videos("long_form")
     st.metric("Long Form", long_count)
 
 st.markdown("---")
@@ -46,11 +48,13 @@ filter_type = st.selectbox(
     index=0,
 )
 
-filtered = videos
-if filter_type == "Short Form":
-    filtered = [v for v in videos if v.video_type == "short_form"]
-elif filter_type == "Long Form":
-    filtered = [v for v in videos if v.video_type == "long_form"]
+video_type = {"Short Form": "short_form", "Long Form": "long_form"}.get(filter_type)
+filtered_count = {"short_form": short_count, "long_form": long_count}.get(video_type, total_count)
+
+# Pagination
+page_count = max(1, (filtered_count + PAGE_SIZE - 1) // PAGE_SIZE)
+page = st.number_input("Page", min_value=1, max_value=page_count, value=1, step=1) if page_count > 1 else 1
+filtered = get_all_videos(limit=PAGE_SIZE, offset=(page - 1) * PAGE_SIZE, video_type=video_type)
 
 # Display videos
 for video in filtered:
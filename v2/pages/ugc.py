@@ -28,6 +28,8 @@ import streamlit as st
 from v2.core.config import (
     TONES,
     PLATFORMS,
+    ORIENTATIONS,
+    IMAGE_PROVIDERS,
     VOICE_ACTOR_NAMES,
     VISUAL_MODES,
     VIDEO_PROVIDERS,
@@ -127,7 +129,7 @@ with col_config:
     c3, c4 = st.columns(2)
     with c3:
         orientation = st.selectbox(
-            "Orientation", options=["Portrait", "Landscape"], index=0, key="ugc_orient",
+            "Orientation", options=ORIENTATIONS, index=0, key="ugc_orient",
         )
     with c4:
         tone = st.selectbox("Tone", options=TONES, index=1, key="ugc_tone")  # Conversational
@@ -167,7 +169,7 @@ with col_config:
         )
     with c6:
         image_provider = st.selectbox(
-            "Image Provider", options=["google", "openai", "flux"],
+            "Image Provider", options=IMAGE_PROVIDERS,
             index=0, key="ugc_img_prov",
         )
 
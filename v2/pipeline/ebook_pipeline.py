@@ -5,9 +5,9 @@ Coordinates a multi-agent workflow to produce a professional ebook:
 
   Step 1: Generate outline (structure agent)
   Step 2: Write introduction (intro agent)
-  Step 3: Write chapters sequentially (chapter writer agent, baton-pass continuity)
-  Step 4: Write conclusion (conclusion agent)
-  Step 5: Edit/polish chapters in parallel (editor agent)
+  Step 3: Write chapters in parallel (chapter writer agent, hooks from the outline)
+  Step 4: Write conclusion once all chapters are written (conclusion agent)
+  Step 5: Edit/polish each chapter once it and its neighbours are written (editor agent)
   Step 6: Generate section images if enabled (reuses ImageService)
   Step 7: Generate cover image
   Step 8: Render output files (PDF and/or DOCX via ebook_formatter)
@@ -19,10 +19,12 @@ Error handling follows the same pattern as the video pipeline:
     can display everything that was generated before the error
 
 Architecture note:
-  Chapters are written SEQUENTIALLY (step 3) because each chapter
-  receives the previous chapter's summary for narrative continuity.
-  Editing (step 5) runs in PARALLEL because each chapter is independent
-  at that stage.
+  Chapters are written in PARALLEL (step 3): the outline gives every
+  chapter an opening_hook and closing_bridge, so no chapter needs the
+  previous one's summary. Steps 3-5 share one task group: each edit
+  waits only for its own chapter and the two either side of it (it
+  smooths transitions using their summaries), and the conclusion waits
+  for all chapters, so editing overlaps the slowest remaining writes.
 """
 
 from __future__ import annotations
@@ -41,13 +43,16 @@ from v2.core.ebook_models import (
     EbookState,
     EbookConfig,
     ChapterState,
+    ChapterOutline,
     ChapterContentContainer,
     EditedChapterContainer,
     EbookOutlineContainer,
     IntroductionContainer,
     ConclusionContainer,
     CoverDescriptionContainer,
+    SectionImageDescriptionContainer,
     SectionContent,
+    SECTION_LIST_ADAPTER,
 )
 from v2.core.ebook_prompts import (
     EBOOK_OUTLINE_PROMPT,
@@ -202,107 +207,86 @@ class EbookPipeline:
         except Exception as e:
             _fail("write_introduction", e)
 
-        # ─── Step 3: Write chapters (sequential for continuity) ──────
-        # Each chapter receives the previous chapter's summary so it can
-        # pick up where the last one left off ("baton pass" pattern).
+        # ─── Steps 3-5: Write chapters, conclusion, edit (overlapped) ─
+        # All chapters are written in parallel. Continuity comes from each
+        # chapter's opening_hook / closing_bridge in the outline, so no
+        # chapter waits on the previous one's summary. A chapter's edit
+        # starts as soon as it and its neighbours are written (the editor
+        # needs their summaries), and the conclusion as soon as every
+        # chapter is, so editing overlaps the remaining writes.
+        _progress(f"Writing and editing {num_chapters} chapters...", 0.12)
         all_chapter_titles = [ch.outline.chapter_title for ch in state.chapters]
-        previous_summary = ""
-
-        for ch_idx, chapter in enumerate(state.chapters):
-            try:
-                _progress(
-                    f"Writing chapter {ch_idx + 1}/{num_chapters}: "
-                    f"{chapter.outline.chapter_title}...",
-                    0.12 + (ch_idx / num_chapters) * 0.40,
-                )
-
-                chapter_result = self.llm.generate_structured(
-                    system_prompt=EBOOK_CHAPTER_WRITER_PROMPT,
-                    user_payload={
-                        "ebook_title": state.outline.ebook_title,
-                        "target_audience": config.target_audience,
-                        "tone": config.tone,
-                        "writing_style": config.writing_style,
-                        "chapter_outline": chapter.outline.model_dump(),
-                        "previous_chapter_summary": previous_summary,
-                        "full_outline_context": json.dumps(all_chapter_titles),
-                        "additional_instructions": config.additional_instructions,
-                    },
-                    output_model=ChapterContentContainer,
-                )
-
-                chapter.raw_sections = chapter_result.sections
-                chapter.raw_summary = chapter_result.chapter_summary
-                previous_summary = chapter_result.chapter_summary
-
-                _save_ebook_checkpoint(state, f"after_chapter_{ch_idx + 1}")
-            except PipelineError:
-                raise
-            except Exception as e:
-                _fail(f"write_chapter_{ch_idx + 1}", e)
+        named_tasks: list[tuple[str, asyncio.Task]] = []
+
+        async def _write(chapter: ChapterState) -> None:
+            chapter_result = await asyncio.to_thread(
+                self._write_chapter,
+                ebook_title=state.outline.ebook_title,
+                config=config,
+                all_chapter_titles=all_chapter_titles,
+                chapter_outline=chapter.outline,
+            )
+            chapter.raw_sections = chapter_result.sections
+            chapter.raw_summary = chapter_result.chapter_summary
+
+        async def _edit(ch_idx: int, write_tasks: list[asyncio.Task]) -> None:
+            await asyncio.gather(*write_tasks[max(ch_idx - 1, 0):ch_idx + 2])
+            # Provide surrounding chapter context for transition polish
+            prev_summary = (
+                state.chapters[ch_idx - 1].raw_summary
+                if ch_idx > 0 else ""
+            )
+            next_summary = (
+                state.chapters[ch_idx + 1].raw_summary
+                if ch_idx < num_chapters - 1 else ""
+            )
+            chapter = state.chapters[ch_idx]
+            chapter.edited_sections = await asyncio.to_thread(
+                self._edit_chapter,
+                chapter_title=chapter.outline.chapter_title,
+                sections=chapter.raw_sections,
+                prev_summary=prev_summary,
+                next_summary=next_summary,
+                tone=config.tone,
+                writing_style=config.writing_style,
+            )
 
-        # ─── Step 4: Write conclusion ────────────────────────────────
-        try:
+        async def _conclude(write_tasks: list[asyncio.Task]) -> None:
+            await asyncio.gather(*write_tasks)
+            _save_ebook_checkpoint(state, "after_chapters")
             _progress("Writing conclusion...", 0.55)
-            all_summaries = [ch.raw_summary for ch in state.chapters]
-            conclusion_result = self.llm.generate_structured(
-                system_prompt=EBOOK_CONCLUSION_PROMPT,
-                user_payload={
-                    "title": state.outline.ebook_title,
-                    "topic": config.topic,
-                    "target_audience": config.target_audience,
-                    "tone": config.tone,
-                    "writing_style": config.writing_style,
-                    "chapter_summaries": all_summaries,
-                    "additional_instructions": config.additional_instructions,
-                },
-                output_model=ConclusionContainer,
+            conclusion_result = await asyncio.to_thread(
+                self._write_conclusion, state=state, config=config
             )
             state.conclusion_text = conclusion_result.conclusion_text
             _save_ebook_checkpoint(state, "after_conclusion")
-        except PipelineError:
-            raise
-        except Exception as e:
-            _fail("write_conclusion", e)
 
-        # ─── Step 5: Edit/polish chapters (parallel) ─────────────────
         try:
-            _progress("Editing and polishing chapters...", 0.60)
-            edit_tasks = []
-
             async with asyncio.TaskGroup() as tg:
+                write_tasks = []
                 for ch_idx, chapter in enumerate(state.chapters):
-                    # Provide surrounding chapter context for transition polish
-                    prev_summary = (
-                        state.chapters[ch_idx - 1].raw_summary
-                        if ch_idx > 0 else ""
-                    )
-                    next_summary = (
-                        state.chapters[ch_idx + 1].raw_summary
-                        if ch_idx < num_chapters - 1 else ""
-                    )
-
-                    task = tg.create_task(
-                        asyncio.to_thread(
-                            self._edit_chapter,
-                            chapter_title=chapter.outline.chapter_title,
-                            sections=chapter.raw_sections,
-                            prev_summary=prev_summary,
-                            next_summary=next_summary,
-                            tone=config.tone,
-                            writing_style=config.writing_style,
-                        )
-                    )
-                    edit_tasks.append((ch_idx, task))
-
-            for ch_idx, task in edit_tasks:
-                state.chapters[ch_idx].edited_sections = task.result()
+                    task = tg.create_task(_write(chapter))
+                    write_tasks.append(task)
+                    named_tasks.append((f"write_chapter_{ch_idx + 1}", task))
+                named_tasks.append(("write_conclusion", tg.create_task(_conclude(write_tasks))))
+                for ch_idx in range(num_chapters):
+                    task = tg.create_task(_edit(ch_idx, write_tasks))
+                    named_tasks.append((f"edit_chapter_{ch_idx + 1}", task))
 
             _save_ebook_checkpoint(state, "after_editing")
         except PipelineError:
             raise
         except Exception as e:
-            _fail("edit_chapters", e)
+            # Name the step after the first task that raised (writes come
+            # first in named_tasks); the others were cancelled by the group
+            failed_step = next(
+                (
+                    name for name, task in named_tasks
+                    if task.done() and not task.cancelled() and task.exception() is not None
+                ),
+                "write_and_edit_chapters",
+            )
+            _fail(failed_step, e)
 
         # ─── Step 6: Generate section images (if enabled, parallel) ──
         if config.include_images:
@@ -376,6 +360,57 @@ class EbookPipeline:
     # Private helper methods
     # ------------------------------------------------------------------
 
+    def _write_chapter(
+        self,
+        ebook_title: str,
+        config: EbookConfig,
+        all_chapter_titles: list[str],
+        chapter_outline: ChapterOutline,
+    ) -> ChapterContentContainer:
+        """
+        Write a single chapter via the chapter writer agent LLM call.
+        Called in a thread from the parallel writing step.
+        """
+        # Fields that are the same for every chapter come first and the
+        # per-chapter outline last, so the calls share the longest possible
+        # prompt prefix for provider prefix caching.
+        return self.llm.generate_structured(
+            system_prompt=EBOOK_CHAPTER_WRITER_PROMPT,
+            user_payload={
+                "ebook_title": ebook_title,
+                "target_audience": config.target_audience,
+                "tone": config.tone,
+                "writing_style": config.writing_style,
+                "full_outline_context": json.dumps(all_chapter_titles),
+                "additional_instructions": config.additional_instructions,
+                "chapter_outline": chapter_outline.model_dump(),
+            },
+            output_model=ChapterContentContainer,
+        )
+
+    def _write_conclusion(
+        self,
+        state: EbookState,
+        config: EbookConfig,
+    ) -> ConclusionContainer:
+        """
+        Write the conclusion via the conclusion agent LLM call.
+        Called in a thread once every chapter has been written.
+        """
+        return self.llm.generate_structured(
+            system_prompt=EBOOK_CONCLUSION_PROMPT,
+            user_payload={
+                "title": state.outline.ebook_title,
+                "topic": config.topic,
+                "target_audience": config.target_audience,
+                "tone": config.tone,
+                "writing_style": config.writing_style,
+                "chapter_summaries": [ch.raw_summary for ch in state.chapters],
+                "additional_instructions": config.additional_instructions,
+            },
+            output_model=ConclusionContainer,
+        )
+
     def _edit_chapter(
         self,
         chapter_title: str,
@@ -393,7 +428,7 @@ class EbookPipeline:
             system_prompt=EBOOK_EDITOR_PROMPT,
             user_payload={
                 "chapter_title": chapter_title,
-                "sections": [s.model_dump() for s in sections],
+                "sections": SECTION_LIST_ADAPTER.dump_python(sections),
                 "previous_chapter_summary": prev_summary,
                 "next_chapter_summary": next_summary,
                 "tone": tone,
@@ -465,17 +500,9 @@ class EbookPipeline:
 
     def _generate_section_image_description(self, payload: dict) -> str:
         """Generate a single section image description via LLM."""
-        from v2.core.ebook_prompts import EBOOK_SECTION_IMAGE_PROMPT
-
-        # Use a simple Pydantic model for the response
-        from pydantic import BaseModel, Field
-
-        class _ImageDescResult(BaseModel):
-            image_description: str = Field(...)
-
         result = self.llm.generate_structured(
             system_prompt=EBOOK_SECTION_IMAGE_PROMPT,
             user_payload=payload,
-            output_model=_ImageDescResult,
+            output_model=SectionImageDescriptionContainer,
         )
         return result.image_description
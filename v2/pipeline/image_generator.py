@@ -58,6 +58,12 @@ logger = logging.getLogger(__name__)
 # Number of worker processes for CPU-bound FFmpeg animation jobs
 NUM_WORKERS = os.cpu_count() or 4
 
+# Segments described per LLM call. Batching shares the prompt and script
+# context across segments; keeping batches small keeps each reply short
+# enough that the batches, run in parallel, finish about as fast as
+# one-call-per-segment did.
+DESCRIPTION_BATCH_SIZE = 4
+
 ProgressCallback = Optional[Callable[[str], None]]
 
 
@@ -141,9 +147,10 @@ class ImageGenerator:
         """
         Generate image descriptions for all segments using parallel LLM calls.
 
-        Each segment gets its own TaskGroup task that calls the LLM to produce
-        detailed image prompts. The descriptions are stored in each plan's
-        `image_descriptions` list.
+        Segments are grouped DESCRIPTION_BATCH_SIZE at a time, and each group
+        gets its own TaskGroup task that calls the LLM once to produce detailed
+        image prompts for all of its segments. The descriptions are stored in
+        each plan's `image_descriptions` list.
 
         These descriptions are used both for static image generation (zoompan)
         and as text prompts for video generation APIs.
@@ -164,24 +171,27 @@ class ImageGenerator:
         if on_progress:
             on_progress(f"Generating image descriptions for {len(segments)} segments...")
 
+        seg_texts = []
+        for i in range(len(visual_plans)):
+            # Extract raw script text from the segment (supports multiple formats)
+            seg = segments[i]
+            if hasattr(seg, "script_segment"):
+                seg_texts.append(seg.script_segment)
+            elif isinstance(seg, dict):
+                seg_texts.append(seg.get("script_segment", str(seg)))
+            else:
+                seg_texts.append(str(seg))
+
         tasks = []
         async with asyncio.TaskGroup() as tg:
-            for i, plan in enumerate(visual_plans):
-                # Extract raw script text from the segment (supports multiple formats)
-                seg = segments[i]
-                if hasattr(seg, "script_segment"):
-                    seg_text = seg.script_segment
-                elif isinstance(seg, dict):
-                    seg_text = seg.get("script_segment", str(seg))
-                else:
-                    seg_text = str(seg)
-
+            for start in range(0, len(visual_plans), DESCRIPTION_BATCH_SIZE):
+                end = start + DESCRIPTION_BATCH_SIZE
                 task = tg.create_task(
                     asyncio.to_thread(
-                        self.script_gen.generate_segment_image_descriptions,
-                        script_segment=seg_text,
+                        self.script_gen.generate_batch_segment_image_descriptions,
+                        script_segments=seg_texts[start:end],
+                        num_images=[plan.num_images for plan in visual_plans[start:end]],
                         full_script=full_script,
-                        num_images=plan.num_images,
                         image_style=image_style,
                         topic=topic,
                         tone=tone,
@@ -189,11 +199,12 @@ class ImageGenerator:
                         allow_faces=allow_faces,
                     )
                 )
-                tasks.append((i, task))
+                tasks.append((start, task))
 
         # Collect results back into visual plans
-        for i, task in tasks:
-            visual_plans[i].image_descriptions = task.result()
+        for start, task in tasks:
+            for offset, descriptions in enumerate(task.result()):
+                visual_plans[start + offset].image_descriptions = descriptions
 
         logger.info(f"Generated descriptions for {len(visual_plans)} segments")
         return visual_plans
@@ -23,8 +23,6 @@ from datetime import datetime
 from pathlib import Path
 from typing import Callable, Optional, Union
 
-from pydantic import BaseModel, Field
-
 from v2.core.config import OUTPUT_DIR
 from v2.core.models import (
     ImageDescription,
@@ -43,6 +41,7 @@ from v2.core.v2_models import (
     SectionScriptV2,
     SectionV2State,
     SegmentStoryboard,
+    StoryboardContainer,
     ShortFormV2State,
     ShotPlan,
     StyleGuide,
@@ -64,9 +63,9 @@ from v2.core.v2_prompts import (
     OUTLINE_QUALITY_GATE_PROMPT,
     SECTION_SCRIPT_V2_PROMPT,
     SECTION_SCRIPT_CONNECTOR_PROMPT,
-    SECTION_SEGMENTER_V2_PROMPT,
 )
 from v2.core.database import save_video_record
+from v2.core.segmenter import segment_text
 from v2.pipeline.audio_generator import AudioGenerator, compute_images_per_segment
 from v2.pipeline.image_generator import ImageGenerator
 from v2.pipeline.script_generator import ScriptGenerator
@@ -128,14 +127,6 @@ def _save_checkpoint(
         return None
 
 
-# ---------------------------------------------------------------------------
-# Segmenter container for V2 (simple list of strings)
-# ---------------------------------------------------------------------------
-class SegmentsContainer(BaseModel):
-    """LLM output: list of script segments."""
-    segments: list[str] = Field(..., description="Script segments.")
-
-
 class PipelineRunnerV2:
     """
     Enhanced pipeline orchestrator with research, quality gates, and
@@ -709,9 +700,6 @@ class PipelineRunnerV2:
 
         style_data = state.style_guide.model_dump() if state.style_guide else {}
 
-        class StoryboardContainer(BaseModel):
-            storyboard: list[SegmentStoryboard]
-
         result = self.llm.generate_structured(
             system_prompt=prompt,
             user_payload={
@@ -940,14 +928,8 @@ class PipelineRunnerV2:
             sec.audio_path = audio_path
             sec.word_alignments = word_alignments
 
-            # Segment the script
-            seg_result = await asyncio.to_thread(
-                self.llm.generate_structured,
-                system_prompt=SECTION_SEGMENTER_V2_PROMPT,
-                user_payload={"section_script": sec.section_script},
-                output_model=SegmentsContainer,
-            )
-            sec.segments = seg_result.segments
+            # Segment the script (local, no LLM call)
+            sec.segments = segment_text(sec.section_script)
 
             # Align segments to audio
             sec.segment_timings = ElevenLabsService.align_segments_to_words(
@@ -972,9 +954,6 @@ class PipelineRunnerV2:
         prompt = STORYBOARD_PROMPT.format(face_rule=face_rule)
         style_data = style_guide.model_dump()
 
-        class StoryboardContainer(BaseModel):
-            storyboard: list[SegmentStoryboard]
-
         async def _gen_storyboard(sec: SectionV2State) -> None:
             beats_data = []
             for i, seg_text in enumerate(sec.segments):
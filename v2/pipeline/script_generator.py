@@ -18,9 +18,9 @@ from v2.core.models import (
     SectionsStructureContainer,
     SectionStructure,
     SectionScriptContainer,
-    SectionScriptSegmentedContainer,
     SectionScriptSegmentItem,
     SegmentImageDescriptionsContainer,
+    BatchSegmentImageDescriptionsContainer,
     ImageDescription,
 )
 from v2.core.prompts import (
@@ -30,12 +30,13 @@ from v2.core.prompts import (
     SCRIPT_ENHANCEMENT_PROMPT,
     SCRIPT_SEGMENTATION_PROMPT,
     SEGMENT_IMAGE_DESCRIPTIONS_PROMPT_TEMPLATE,
+    SEGMENT_IMAGE_DESCRIPTIONS_BATCH_PROMPT_TEMPLATE,
     FACE_FREE_RULE,
     FACES_ALLOWED_RULE,
     LONG_FORM_STRUCTURE_PROMPT,
     LONG_FORM_SECTION_SCRIPT_PROMPT,
-    LONG_FORM_SECTION_SEGMENTER_PROMPT,
 )
+from v2.core.segmenter import segment_script_tracks, segment_text
 from v2.services.llm_service import LLMService
 
 logger = logging.getLogger(__name__)
@@ -48,6 +49,8 @@ class ScriptGenerator:
 
     def __init__(self, provider: str = "google"):
         self.llm = LLMService(provider=provider)
+        # goal and hook are one-line outputs, so they go to the small model
+        self.fast_llm = LLMService(provider=provider, fast=True)
 
     # ------------------------------------------------------------------
     # SHORT-FORM steps
@@ -63,7 +66,7 @@ class ScriptGenerator:
         if on_progress:
             on_progress("Generating video goal...")
 
-        result = self.llm.generate_structured(
+        result = self.fast_llm.generate_structured(
             system_prompt=GOAL_GENERATION_PROMPT,
             user_payload={
                 "topic": topic,
@@ -87,7 +90,7 @@ class ScriptGenerator:
         if on_progress:
             on_progress("Crafting opening hook...")
 
-        result = self.llm.generate_structured(
+        result = self.fast_llm.generate_structured(
             system_prompt=HOOK_GENERATION_PROMPT,
             user_payload={
                 "topic": topic,
@@ -149,6 +152,7 @@ class ScriptGenerator:
             system_prompt=SCRIPT_ENHANCEMENT_PROMPT,
             user_payload={"script": script},
             output_model=EnhancedScriptContainer,
+            cache=True,
         )
         logger.info("Script enhanced for TTS")
         return result.enhanced_script
@@ -162,6 +166,12 @@ class ScriptGenerator:
         if on_progress:
             on_progress("Segmenting script into clips...")
 
+        segments = segment_script_tracks(script, enhanced_script)
+        if segments is not None:
+            logger.info(f"Script segmented into {len(segments)} clips")
+            return segments
+
+        # The enhancer rewrote too much to align the tracks locally
         result = self.llm.generate_structured(
             system_prompt=SCRIPT_SEGMENTATION_PROMPT,
             user_payload={
@@ -169,6 +179,7 @@ class ScriptGenerator:
                 "enhanced_script": enhanced_script,
             },
             output_model=ScriptListContainer,
+            cache=True,
         )
         logger.info(f"Script segmented into {len(result.script_list)} clips")
         return result.script_list
@@ -210,6 +221,74 @@ class ScriptGenerator:
         )
         return result.segment_image_descriptions
 
+    def generate_batch_segment_image_descriptions(
+        self,
+        script_segments: list[str],
+        num_images: list[int],
+        full_script: str,
+        image_style: str,
+        topic: str,
+        tone: str,
+        additional_image_requests: str | None = None,
+        allow_faces: bool = False,
+    ) -> list[list[ImageDescription]]:
+        """
+        Generate image descriptions for several segments in one LLM call.
+
+        Returns one description list per segment, in input order. If the
+        model returns the wrong number of entries, every segment is redone
+        individually; a single entry with the wrong number of descriptions
+        is redone on its own.
+        """
+        single_kwargs = dict(
+            full_script=full_script,
+            image_style=image_style,
+            topic=topic,
+            tone=tone,
+            additional_image_requests=additional_image_requests,
+            allow_faces=allow_faces,
+        )
+        if len(script_segments) == 1:
+            return [self.generate_segment_image_descriptions(
+                script_segment=script_segments[0], num_images=num_images[0], **single_kwargs
+            )]
+
+        face_rule = FACES_ALLOWED_RULE if allow_faces else FACE_FREE_RULE
+        prompt = SEGMENT_IMAGE_DESCRIPTIONS_BATCH_PROMPT_TEMPLATE.format(face_rule=face_rule)
+
+        result = self.llm.generate_structured(
+            system_prompt=prompt,
+            user_payload={
+                "full_script": full_script,
+                "additional_image_requests": additional_image_requests or "",
+                "image_style": image_style,
+                "topic": topic,
+                "tone": tone,
+                "segments": [
+                    {"script_segment": segment, "num_of_image_descriptions": num}
+                    for segment, num in zip(script_segments, num_images)
+                ],
+            },
+            output_model=BatchSegmentImageDescriptionsContainer,
+        )
+        batched = result.batched_descriptions
+        if len(batched) != len(script_segments):
+            logger.warning(
+                f"Batched descriptions returned {len(batched)} entries for "
+                f"{len(script_segments)} segments; generating per segment"
+            )
+            batched = [None] * len(script_segments)
+
+        descriptions = []
+        for segment, num, entry in zip(script_segments, num_images, batched):
+            if entry is not None and len(entry.segment_image_descriptions) == num:
+                descriptions.append(entry.segment_image_descriptions)
+            else:
+                descriptions.append(self.generate_segment_image_descriptions(
+                    script_segment=segment, num_images=num, **single_kwargs
+                ))
+        return descriptions
+
     # ------------------------------------------------------------------
     # LONG-FORM steps
     # ------------------------------------------------------------------
@@ -282,10 +361,9 @@ class ScriptGenerator:
         section_script: str,
     ) -> list[SectionScriptSegmentItem]:
         """Split a section script into vocal-unit segments."""
-        result = self.llm.generate_structured(
-            system_prompt=LONG_FORM_SECTION_SEGMENTER_PROMPT,
-            user_payload={"section_script": section_script},
-            output_model=SectionScriptSegmentedContainer,
-        )
-        logger.info(f"Section segmented into {len(result.script_segment_list)} parts")
-        return result.script_segment_list
+        segments = [
+            SectionScriptSegmentItem(script_segment=segment)
+            for segment in segment_text(section_script)
+        ]
+        logger.info(f"Section segmented into {len(segments)} parts")
+        return segments
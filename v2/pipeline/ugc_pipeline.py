@@ -58,7 +58,6 @@ from v2.core.ugc_models import (
     UGCState,
     UGCSceneDescription,
     UGCScenePlanContainer,
-    UGCScriptContainer,
 )
 from v2.core.ugc_prompts import (
     UGC_SCRIPT_WRITER_PROMPT,
@@ -212,7 +211,9 @@ class UGCPipeline:
                 [a.model_dump() for a in state.reference_analyses]
             ) if state.reference_analyses else "[]"
 
-            script_result = self.llm.generate_structured(
+            # The script is a single free-text field, so it's requested as
+            # plain text rather than JSON: nothing to parse or escape
+            state.script = self.llm.generate_text(
                 system_prompt=UGC_SCRIPT_WRITER_PROMPT,
                 user_payload={
                     "product_name": config.product_name,
@@ -224,9 +225,7 @@ class UGCPipeline:
                     "script_guidance": config.script_guidance,
                     "allow_faces": config.allow_faces,
                 },
-                output_model=UGCScriptContainer,
             )
-            state.script = script_result.script
             _save_ugc_checkpoint(state, "after_script")
         except PipelineError:
             raise
@@ -323,8 +322,12 @@ class UGCPipeline:
         try:
             _progress("Generating product images in realistic environments...", 0.58)
 
-            # Collect all image prompts from the scene plan
-            image_prompts = [scene.image_prompt for scene in state.scene_descriptions]
+            # Collect all image prompts from the scene plan, with the product
+            # description filled in for the placeholder
+            image_prompts = [
+                scene.render(state.product_visual_description or config.product_name)
+                for scene in state.scene_descriptions
+            ]
 
             # Force photo realism for UGC (override any other style)
             scene_image_paths = await self.image_service.generate_images(
@@ -32,7 +32,6 @@ from __future__ import annotations
 
 import base64
 import logging
-import os
 import uuid
 from difflib import SequenceMatcher
 from pathlib import Path
@@ -45,7 +44,7 @@ from tenacity import (
     retry_if_exception_type,
 )
 
-from v2.core.config import AUDIO_DIR, VOICE_ACTORS
+from v2.core.config import AUDIO_DIR, VOICE_ACTORS, get_settings
 from v2.core.models import WordAlignment, SegmentTiming
 
 logger = logging.getLogger(__name__)
@@ -62,7 +61,7 @@ class ElevenLabsService:
     """
 
     def __init__(self):
-        api_key = os.getenv("ELEVEN_LABS_API_KEY")
+        api_key = get_settings().eleven_labs_api_key
         if not api_key:
             raise ValueError("ELEVEN_LABS_API_KEY not set in environment")
         self._client = ElevenLabs(api_key=api_key)
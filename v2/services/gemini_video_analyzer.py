@@ -12,7 +12,9 @@ This service is used by the UGC pipeline to:
   3. Describe product appearance from uploaded product photos
 
 The Gemini Files API is used for video uploads (supports files >20MB),
-and the model processes both the visual frames and audio track.
+and the model processes both the visual frames and audio track. Responses
+are constrained to the container model's JSON schema by the API, so no
+text cleanup or JSON parsing is done here.
 
 Usage:
     analyzer = GeminiVideoAnalyzer()
@@ -27,15 +29,16 @@ from __future__ import annotations
 
 import asyncio
 import base64
-import json
 import logging
-import os
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Type, TypeVar
 
 from google import genai
+from google.genai import types
+from pydantic import BaseModel
 from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
 
+from v2.core.config import get_settings
 from v2.core.ugc_models import (
     ReferenceVideoAnalysis,
     ReferenceVideoAnalysisContainer,
@@ -52,6 +55,23 @@ logger = logging.getLogger(__name__)
 # Flash is cheaper and faster; sufficient for structured extraction
 GEMINI_ANALYSIS_MODEL = "gemini-2.5-flash"
 
+T = TypeVar("T", bound=BaseModel)
+
+
+def _parse_response(response: types.GenerateContentResponse, output_model: Type[T]) -> T:
+    """Return the SDK-parsed response model, validating the raw text if it's missing."""
+    if isinstance(response.parsed, output_model):
+        return response.parsed
+    return output_model.model_validate_json(response.text)
+
+
+def _json_config(output_model: Type[BaseModel]) -> types.GenerateContentConfig:
+    """Generation config that constrains the response to output_model's schema."""
+    return types.GenerateContentConfig(
+        response_mime_type="application/json",
+        response_schema=output_model,
+    )
+
 
 class GeminiVideoAnalyzer:
     """
@@ -65,7 +85,7 @@ class GeminiVideoAnalyzer:
 
     def __init__(self):
         """Initialize the Gemini client with the Google API key."""
-        api_key = os.environ.get("GOOGLE_API_KEY")
+        api_key = get_settings().google_api_key
         if not api_key:
             raise ValueError("GOOGLE_API_KEY not set in environment")
         self._client = genai.Client(api_key=api_key)
@@ -81,8 +101,8 @@ class GeminiVideoAnalyzer:
         Analyze a single reference video using Gemini multimodal.
 
         Uploads the video via the Gemini Files API, then sends it with the
-        analysis prompt. Parses the structured JSON response into a
-        ReferenceVideoAnalysis object.
+        analysis prompt, with the response constrained to the
+        ReferenceVideoAnalysisContainer schema.
 
         Args:
             video_path: Path to the video file on disk (.mp4, .mov, .webm).
@@ -108,18 +128,9 @@ class GeminiVideoAnalyzer:
             response = self._client.models.generate_content(
                 model=GEMINI_ANALYSIS_MODEL,
                 contents=[uploaded_file, UGC_REFERENCE_VIDEO_ANALYSIS_PROMPT],
+                config=_json_config(ReferenceVideoAnalysisContainer),
             )
-
-            # Parse the JSON response
-            response_text = response.text.strip()
-            # Strip markdown code fences if present
-            if response_text.startswith("```"):
-                lines = response_text.split("\n")
-                response_text = "\n".join(lines[1:-1])
-
-            parsed = json.loads(response_text)
-            container = ReferenceVideoAnalysisContainer(**parsed)
-            return container.analysis
+            return _parse_response(response, ReferenceVideoAnalysisContainer).analysis
 
         return await asyncio.to_thread(_sync_analyze)
 
@@ -208,16 +219,9 @@ class GeminiVideoAnalyzer:
             response = self._client.models.generate_content(
                 model=GEMINI_ANALYSIS_MODEL,
                 contents=content_parts,
+                config=_json_config(ProductVisualDescriptionContainer),
             )
-
-            # Parse the JSON response
-            response_text = response.text.strip()
-            if response_text.startswith("```"):
-                lines = response_text.split("\n")
-                response_text = "\n".join(lines[1:-1])
-
-            parsed = json.loads(response_text)
-            container = ProductVisualDescriptionContainer(**parsed)
+            container = _parse_response(response, ProductVisualDescriptionContainer)
             return container.product_visual_description
 
         return await asyncio.to_thread(_sync_describe)
@@ -7,9 +7,9 @@ from __future__ import annotations
 import asyncio
 import base64
 import logging
-import os
 import time
 import uuid
+import weakref
 from pathlib import Path
 from typing import Optional
 
@@ -26,28 +26,16 @@ from v2.core.config import (
     GOOGLE_SEMAPHORE,
     OPENAI_SEMAPHORE,
     FLUX_SEMAPHORE,
+    get_settings,
 )
 
 logger = logging.getLogger(__name__)
 
 
 class _RateLimiters:
-    """Per-event-loop rate limiters and semaphores for image generation APIs."""
+    """Rate limiters and semaphores for image generation APIs, for one event loop."""
 
     def __init__(self):
-        self._loop = None
-        self.google_limiter: Optional[AsyncLimiter] = None
-        self.openai_limiter: Optional[AsyncLimiter] = None
-        self.flux_limiter: Optional[AsyncLimiter] = None
-        self.google_sem: Optional[asyncio.Semaphore] = None
-        self.openai_sem: Optional[asyncio.Semaphore] = None
-        self.flux_sem: Optional[asyncio.Semaphore] = None
-
-    def ensure(self):
-        loop = asyncio.get_running_loop()
-        if self._loop is loop:
-            return
-        self._loop = loop
         self.google_limiter = AsyncLimiter(max_rate=1, time_period=RATE_LIMIT_PERIOD)
         self.openai_limiter = AsyncLimiter(max_rate=1, time_period=RATE_LIMIT_PERIOD)
         self.flux_limiter = AsyncLimiter(max_rate=1, time_period=RATE_LIMIT_PERIOD)
@@ -56,7 +44,21 @@ class _RateLimiters:
         self.flux_sem = asyncio.Semaphore(FLUX_SEMAPHORE)
 
 
-_limiters = _RateLimiters()
+# asyncio primitives belong to the loop that first waits on them, so each loop
+# gets one shared set, built on first use. Keyed weakly, so a finished
+# pipeline's loop takes its set with it, and two sessions running their own
+# loops never reset each other's throttles.
+_limiters_by_loop: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _RateLimiters]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _get_limiters() -> _RateLimiters:
+    loop = asyncio.get_running_loop()
+    limiters = _limiters_by_loop.get(loop)
+    if limiters is None:
+        limiters = _limiters_by_loop[loop] = _RateLimiters()
+    return limiters
 
 
 class ImageService:
@@ -73,7 +75,6 @@ class ImageService:
 
         Returns list of saved image file paths.
         """
-        _limiters.ensure()
         tasks = []
 
         async with asyncio.TaskGroup() as tg:
@@ -137,7 +138,7 @@ class ImageService:
 
     async def _generate_google(self, prompt: str, orientation: str) -> Optional[bytes]:
         def _sync_generate():
-            client = genai.Client(api_key=os.environ["GOOGLE_API_KEY"])
+            client = genai.Client(api_key=get_settings().google_api_key)
             config = types.GenerateImagesConfig(
                 number_of_images=1,
                 aspect_ratio="16:9" if orientation.lower() == "landscape" else "9:16",
@@ -149,13 +150,14 @@ class ImageService:
             )
             return result.images[0].image_bytes
 
-        async with _limiters.google_sem:
-            async with _limiters.google_limiter:
+        limiters = _get_limiters()
+        async with limiters.google_sem:
+            async with limiters.google_limiter:
                 return await asyncio.to_thread(_sync_generate)
 
     async def _generate_openai(self, prompt: str, orientation: str) -> Optional[bytes]:
         def _sync_generate():
-            client = OpenAI(api_key=os.environ["OPENAI_API_KEY"])
+            client = OpenAI(api_key=get_settings().openai_api_key)
             size = "1536x1024" if orientation.lower() == "landscape" else "1024x1536"
             result = client.images.generate(
                 prompt=prompt,
@@ -165,13 +167,14 @@ class ImageService:
             )
             return base64.b64decode(result.data[0].b64_json)
 
-        async with _limiters.openai_sem:
-            async with _limiters.openai_limiter:
+        limiters = _get_limiters()
+        async with limiters.openai_sem:
+            async with limiters.openai_limiter:
                 return await asyncio.to_thread(_sync_generate)
 
     async def _generate_flux(self, prompt: str, orientation: str) -> Optional[bytes]:
         def _sync_generate():
-            api_key = os.environ.get("BFL_API_KEY")
+            api_key = get_settings().bfl_api_key
             resp = requests.post(
                 "https://api.bfl.ai/v1/flux-2-pro",
                 headers={
@@ -201,6 +204,7 @@ class ImageService:
                     raise RuntimeError(f"Flux generation failed: {poll.get('error')}")
                 time.sleep(0.5)
 
-        async with _limiters.flux_sem:
-            async with _limiters.flux_limiter:
+        limiters = _get_limiters()
+        async with limiters.flux_sem:
+            async with limiters.flux_limiter:
                 return await asyncio.to_thread(_sync_generate)
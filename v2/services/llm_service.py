@@ -13,6 +13,18 @@ the pipeline. Key features:
   - **Automatic retries**: All calls use tenacity with 3 attempts and exponential
     backoff. This handles transient API errors, rate limits, and timeouts.
 
+  - **Response cache**: Pass cache=True for steps that only transform their
+    input (segmentation, TTS enhancement). Identical requests are then served
+    from a JSON file under output/llm_cache instead of calling the LLM again.
+
+  - **Compact payloads**: Dict payloads are sent as compact JSON with empty
+    fields (None, "", [], {}) left out, so an unused optional input such as
+    additional_instructions costs no tokens.
+
+  - **Concurrency cap**: Parallel steps call this service from worker threads.
+    At most MOCEAN_LLM_CONCURRENCY requests are in flight process-wide; the
+    rest wait for a slot. Backoff sleeps between retries don't hold one.
+
 Usage:
     llm = LLMService(provider="google")
     result = llm.generate_structured(
@@ -23,16 +35,21 @@ Usage:
     print(result.goal)  # Typed access to the LLM's response
 
 To add a new provider:
-    1. Add it to LLM_MODELS and LLM_PROVIDER_MAP in config.py
+    1. Add it to LLM_MODELS, LLM_FAST_MODELS and LLM_PROVIDER_MAP in config.py
     2. Ensure the API key env var is set (e.g., DEEPSEEK_API_KEY)
     3. That's it — the service will use it automatically
 """
 
 from __future__ import annotations
 
+import functools
+import hashlib
 import json
 import logging
-from typing import Type, TypeVar
+import threading
+import uuid
+from pathlib import Path
+from typing import Any, Type, TypeVar
 
 from langchain.chat_models import init_chat_model
 from langchain.messages import HumanMessage, SystemMessage
@@ -44,10 +61,59 @@ from tenacity import (
     retry_if_exception_type,
 )
 
-from v2.core.config import LLM_MODELS, LLM_PROVIDER_MAP
+from v2.core.config import (
+    LLM_CACHE_DIR,
+    LLM_FAST_MODELS,
+    LLM_MODELS,
+    LLM_PROVIDER_MAP,
+    get_settings,
+)
 
 logger = logging.getLogger(__name__)
 
+# Providers whose LangChain integration can pass the output model's JSON Schema
+# to the API, so the reply is constrained while it's decoded instead of being
+# parsed (and retried) after the fact. The rest keep LangChain's default
+# tool-calling method.
+_JSON_SCHEMA_PROVIDERS = frozenset({"google", "openai"})
+
+
+@functools.cache
+def _llm_slots() -> threading.BoundedSemaphore:
+    """
+    The process-wide LLM request semaphore.
+
+    A thread semaphore rather than an asyncio one: callers reach the service
+    via asyncio.to_thread from whichever event loop the page created. Built on
+    first use rather than at import, so the size comes from the settings after
+    ensure_runtime_ready() has loaded .env.
+    """
+    return threading.BoundedSemaphore(get_settings().llm_concurrency)
+
+
+_EMPTY_VALUES = (None, "", [], {})
+
+
+def _serialize_payload(user_payload: dict | str) -> str:
+    """
+    Serialize a user payload for the HumanMessage.
+
+    Top-level fields with an empty value are dropped and the JSON is written
+    without spaces. Key order is kept as given: callers put the fields that
+    repeat across calls first so providers can reuse the cached prefix.
+    """
+    if not isinstance(user_payload, dict):
+        return user_payload
+    present = {k: v for k, v in user_payload.items() if v not in _EMPTY_VALUES}
+    return json.dumps(present, separators=(",", ":"))
+
+
+@functools.cache
+def _schema_key(output_model: Type[BaseModel]) -> str:
+    """Canonical JSON schema of an output model, built once per class."""
+    return json.dumps(output_model.model_json_schema(), sort_keys=True)
+
+
 # Generic type variable for structured output models
 T = TypeVar("T", bound=BaseModel)
 
@@ -61,18 +127,29 @@ class LLMService:
         _model:   The initialized LangChain chat model instance.
     """
 
-    def __init__(self, provider: str = "google"):
+    def __init__(self, provider: str = "google", fast: bool = False):
         """
         Initialize the LLM service for a specific provider.
 
         Args:
             provider: One of "google", "openai", "anthropic", "xai", "deepseek".
                       The model name and API config are looked up from config.py.
+            fast:     Use the provider's small model from LLM_FAST_MODELS
+                      instead of the default one.
         """
         self.provider = provider
         provider_key = LLM_PROVIDER_MAP.get(provider, "google-genai")
-        model_name = LLM_MODELS.get(provider, "gemini-2.5-pro")
-        self._model = init_chat_model(model_provider=provider_key, model=model_name)
+        if fast:
+            self.model_name = LLM_FAST_MODELS.get(provider, "gemini-2.5-flash")
+        else:
+            self.model_name = LLM_MODELS.get(provider, "gemini-2.5-pro")
+        self._model = init_chat_model(model_provider=provider_key, model=self.model_name)
+        self._structured_output_kwargs = (
+            {"method": "json_schema"} if provider in _JSON_SCHEMA_PROVIDERS else {}
+        )
+        # Structured-output runnables by output model. Binding converts the
+        # model's schema, so it's done once per model rather than per call.
+        self._structured_models: dict[type, Any] = {}
 
     @retry(
         stop=stop_after_attempt(3),
@@ -85,18 +162,24 @@ class LLMService:
         system_prompt: str,
         user_payload: dict | str,
         output_model: Type[T],
+        cache: bool = False,
     ) -> T:
         """
         Call the LLM with a system prompt and user payload, returning
         a validated Pydantic model instance.
 
         This uses LangChain's `.with_structured_output()` which instructs
-        the LLM to return JSON matching the Pydantic schema.
+        the LLM to return JSON matching the Pydantic schema. For Google and
+        OpenAI the schema is enforced during decoding.
 
         Args:
             system_prompt: The system message defining the LLM's role/task.
-            user_payload:  The user data (dict auto-serialized to JSON string).
+            user_payload:  The user data (dict serialized by _serialize_payload).
             output_model:  Pydantic model class for response validation.
+            cache:         Reuse a stored response for an identical request.
+                           Only for steps where the same input should give
+                           the same output; creative steps leave it off so
+                           regenerating produces something new.
 
         Returns:
             Instance of output_model populated from the LLM's response.
@@ -104,27 +187,59 @@ class LLMService:
         Raises:
             Exception: After 3 failed attempts (propagated from tenacity).
         """
-        structured_model = self._model.with_structured_output(output_model)
-
-        # Convert dict payloads to JSON strings
-        payload_str = (
-            json.dumps(user_payload)
-            if isinstance(user_payload, dict)
-            else user_payload
+        cache_path = (
+            self._cache_path(system_prompt, user_payload, output_model)
+            if cache else None
         )
+        if cache_path is not None and cache_path.exists():
+            logger.info(f"LLM cache hit: {output_model.__name__}")
+            return output_model.model_validate_json(cache_path.read_text(encoding="utf-8"))
+
+        structured_model = self._structured_models.get(output_model)
+        if structured_model is None:
+            structured_model = self._model.with_structured_output(
+                output_model, **self._structured_output_kwargs
+            )
+            self._structured_models[output_model] = structured_model
 
         messages = [
             SystemMessage(content=system_prompt),
-            HumanMessage(content=payload_str),
+            HumanMessage(content=_serialize_payload(user_payload)),
         ]
 
         logger.info(
             f"LLM call: provider={self.provider}, model={output_model.__name__}"
         )
-        result = structured_model.invoke(messages)
+        with _llm_slots():
+            result = structured_model.invoke(messages)
         logger.info(f"LLM response received: {output_model.__name__}")
+
+        if cache_path is not None:
+            # written under a temporary name and renamed, so a parallel step
+            # never reads a half-written entry
+            LLM_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_suffix(f".{uuid.uuid4().hex}.tmp")
+            tmp_path.write_text(result.model_dump_json(), encoding="utf-8")
+            tmp_path.replace(cache_path)
         return result
 
+    def _cache_path(
+        self,
+        system_prompt: str,
+        user_payload: dict | str,
+        output_model: Type[BaseModel],
+    ) -> Path:
+        """
+        Cache file for a request. The key covers the provider, model, output
+        schema, prompt and payload, so changing any of them is a miss.
+        """
+        payload_key = _serialize_payload(user_payload)
+        schema_key = _schema_key(output_model)
+        key = "\0".join(
+            (self.provider, self.model_name, schema_key, system_prompt, payload_key)
+        )
+        return LLM_CACHE_DIR / f"{hashlib.sha256(key.encode('utf-8')).hexdigest()}.json"
+
     @retry(
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=2, min=2, max=30),
@@ -140,16 +255,22 @@ class LLMService:
             user_payload:  The user data.
 
         Returns:
-            Raw text content from the LLM response.
+            The text of the LLM response, stripped of surrounding whitespace.
+
+        Raises:
+            ValueError: If the response has no text. Raised inside the
+                retried call, so an empty reply is retried like any other
+                failure.
         """
-        payload_str = (
-            json.dumps(user_payload)
-            if isinstance(user_payload, dict)
-            else user_payload
-        )
         messages = [
             SystemMessage(content=system_prompt),
-            HumanMessage(content=payload_str),
+            HumanMessage(content=_serialize_payload(user_payload)),
         ]
-        response = self._model.invoke(messages)
-        return response.content
+        with _llm_slots():
+            response = self._model.invoke(messages)
+        # .text rather than .content: providers that return content blocks
+        # (e.g. thinking output) give a list there, .text joins the text blocks
+        text = response.text.strip()
+        if not text:
+            raise ValueError(f"Empty text response from {self.provider}")
+        return text
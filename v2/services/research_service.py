@@ -26,11 +26,11 @@ from __future__ import annotations
 
 import asyncio
 import logging
-import os
 from typing import Optional
 
 from tavily import TavilyClient
 
+from v2.core.config import get_settings
 from v2.core.v2_models import (
     ResearchBrief,
     ResearchQueriesContainer,
@@ -61,7 +61,7 @@ class ResearchService:
         Args:
             llm_provider: LLM provider for query generation and synthesis.
         """
-        api_key = os.getenv("TAVILY_API_KEY")
+        api_key = get_settings().tavily_api_key
         if not api_key:
             raise ValueError(
                 "TAVILY_API_KEY not set in environment. "
@@ -37,7 +37,6 @@ from __future__ import annotations
 
 import asyncio
 import logging
-import os
 import time
 import uuid
 from pathlib import Path
@@ -45,7 +44,7 @@ from typing import Optional
 
 import requests
 
-from v2.core.config import VIDEO_DIR
+from v2.core.config import VIDEO_DIR, get_settings
 
 logger = logging.getLogger(__name__)
 
@@ -165,7 +164,7 @@ class VideoGenerationService:
           2. GET /v1/tasks/{id} polling until status is SUCCEEDED
           3. Download the output video URL
         """
-        api_key = os.environ.get("RUNWAY_API_KEY")
+        api_key = get_settings().runway_api_key
         if not api_key:
             raise RuntimeError(
                 "RUNWAY_API_KEY not set. Add it to your .env file to use Runway."
@@ -257,7 +256,7 @@ class VideoGenerationService:
           2. GET /dream-machine/v1/generations/{id} polling until complete
           3. Download the output video
         """
-        api_key = os.environ.get("LUMA_API_KEY")
+        api_key = get_settings().luma_api_key
         if not api_key:
             raise RuntimeError(
                 "LUMA_API_KEY not set. Add it to your .env file to use Luma."
@@ -349,7 +348,7 @@ class VideoGenerationService:
           2. GET /v1/videos/text2video/{task_id} polling until complete
           3. Download the output video
         """
-        api_key = os.environ.get("KLING_API_KEY")
+        api_key = get_settings().kling_api_key
         if not api_key:
             raise RuntimeError(
                 "KLING_API_KEY not set. Add it to your .env file to use Kling."